@@ -4,22 +4,37 @@
 Print Manager - A tool for double-sided image printing
 """
 
+import time
+STARTUP_T0 = time.perf_counter()  # Startzeit-Messung (vor den uebrigen Imports)
+
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
-from PIL import Image, ImageTk, ImageChops
+from PIL import Image, ImageChops
 import os
 import sys
 from pathlib import Path
 import subprocess
-from reportlab.lib.pagesizes import A4, landscape
-from reportlab.lib.units import cm
-from reportlab.pdfgen import canvas
-from reportlab.lib.utils import ImageReader
-from docx import Document
-from docx.shared import Cm, Inches
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.section import WD_ORIENT
+import importlib
+import importlib.util
+# reportlab und pypdfium2 werden erst bei Bedarf geladen (schneller Start),
+# siehe prewarm_exporters()
 import io
+import zlib
+import hashlib
+import copy
+import contextlib
+import functools
+import re
+import bisect
+import threading
+import logging
+import logging.handlers
+import shutil
+import tempfile
+import zipfile
+import mmap
+from concurrent.futures import ThreadPoolExecutor, wait
+from collections import OrderedDict, deque
 
 try:
     from tkinterdnd2 import DND_FILES, TkinterDnD
@@ -29,25 +44,1431 @@ except ImportError:
     print("Warning: tkinterdnd2 not available. Install with: pip install tkinterdnd2")
     print("Drag & Drop wird nicht funktionieren.")
 
+PDF_INPUT_AVAILABLE = importlib.util.find_spec('pypdfium2') is not None
+
+# Module fuer Export, die nach dem Start im Hintergrund vorgeladen werden
+EXPORTER_MODULES = (
+    'reportlab.pdfgen.canvas',
+    'reportlab.pdfbase.pdfdoc',
+    'reportlab.lib.utils',
+)
+
+
+def prewarm_exporters():
+    """Import exporter modules in the background so the first export does not wait"""
+    for module_name in EXPORTER_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            pass
+
+# Unterstuetzte Eingabeformate
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tif', '.tiff')
+MULTIPAGE_EXTENSIONS = ('.tif', '.tiff', '.pdf')
+PAGE_SEPARATOR = '#page='  # Seitenreferenz: "datei.pdf#page=3"
+PDF_RENDER_DPI = 300
+
+# Grossformatige Bilder (z.B. A3 mit 600 DPI) frueh verkleinern und streifenweise verarbeiten
+LARGE_IMAGE_PIXELS = 30_000_000
+STRIP_HEIGHT = 512  # Zeilen pro Streifen beim Zuschneiden
+
+
+def make_page_ref(path, page_index):
+    """Reference to a single page of a multi-page document"""
+    return f"{path}{PAGE_SEPARATOR}{page_index + 1}"
+
+
+def split_page_ref(image_ref):
+    """(file path, page index or None) for an image reference"""
+    path, sep, page = image_ref.rpartition(PAGE_SEPARATOR)
+    if sep and page.isdigit():
+        return path, int(page) - 1
+    return image_ref, None
+
+
+def open_image(image_ref, pdf_dpi=PDF_RENDER_DPI):
+    """Open an image file or a single page of a multi-page TIFF/PDF (one page decoded at a time)"""
+    path, page_index = split_page_ref(image_ref)
+    if path.lower().endswith('.pdf'):
+        if not PDF_INPUT_AVAILABLE:
+            raise RuntimeError("PDF input requires pypdfium2 (pip install pypdfium2)")
+        import pypdfium2 as pdfium
+        pdf = pdfium.PdfDocument(path)
+        try:
+            page = pdf[page_index or 0]
+            try:
+                return page.render(scale=pdf_dpi / 72).to_pil()
+            finally:
+                page.close()
+        finally:
+            pdf.close()
+    img = Image.open(path)
+    if page_index:
+        img.seek(page_index)
+    return img
+
+
+def iter_input_pages(paths):
+    """Expand input files lazily into page references (multi-page TIFF/PDF: one per page)"""
+    for path in paths:
+        if not path.lower().endswith(MULTIPAGE_EXTENSIONS):
+            yield path
+            continue
+        try:
+            if path.lower().endswith('.pdf'):
+                if not PDF_INPUT_AVAILABLE:
+                    raise RuntimeError("PDF input requires pypdfium2 (pip install pypdfium2)")
+                import pypdfium2 as pdfium
+                pdf = pdfium.PdfDocument(path)
+                try:
+                    page_count = len(pdf)
+                finally:
+                    pdf.close()
+            else:
+                with Image.open(path) as img:
+                    page_count = getattr(img, 'n_frames', 1)
+        except Exception:
+            # Unveraendert weitergeben: die Vorabpruefung meldet die Datei als unlesbar
+            yield path
+            continue
+        if page_count == 1 and not path.lower().endswith('.pdf'):
+            yield path
+        else:
+            for page_index in range(page_count):
+                yield make_page_ref(path, page_index)
+
+
+# Grosse Vorschau: kleine Version sofort aus dem Cache, scharfe Version im Hintergrund
+PREVIEW_SIZE = (400, 300)
+PREVIEW_LOW_SIZE = (100, 75)
+PREVIEW_PREFETCH = 2  # Paare vor und zurueck, die vorab gerendert werden
+PREVIEW_POLL_MS = 30
+
+
+def load_preview_images(image_path):
+    """Decode once, return the large preview and a small copy (runs in a worker, no Tk)"""
+    img = open_image(image_path, pdf_dpi=72)
+    # Thumbnail vor dem Spiegeln, damit JPEG-Draft greift; gespiegelt wird erst bei der Anzeige
+    img.thumbnail(PREVIEW_SIZE, Image.Resampling.LANCZOS)
+    img.load()
+    low = img.copy()
+    low.thumbnail(PREVIEW_LOW_SIZE, Image.Resampling.BILINEAR)
+    return {'full': img, 'low': low}
+
+
+# Vorabpruefung beim Import
+PREFLIGHT_MIN_DPI = 150  # darunter wird ein Bild als zu gering aufgeloest gemeldet
+PREFLIGHT_PRINT_SIDE_CM = 27.7  # laengste bedruckbare Seite (A4, 1 cm Rand)
+EXIF_ORIENTATION = 0x0112
+# EXIF-Orientierung (2-8) und Benutzer-Spiegelung als Transpose-Operation (wie ImageOps.exif_transpose)
+ORIENTATION_TRANSPOSE = {
+    2: Image.Transpose.FLIP_LEFT_RIGHT,
+    3: Image.Transpose.ROTATE_180,
+    4: Image.Transpose.FLIP_TOP_BOTTOM,
+    5: Image.Transpose.TRANSPOSE,
+    6: Image.Transpose.ROTATE_270,
+    7: Image.Transpose.TRANSVERSE,
+    8: Image.Transpose.ROTATE_90,
+}
+MIRROR_TRANSPOSE = {
+    'h': Image.Transpose.FLIP_LEFT_RIGHT,
+    'horizontal': Image.Transpose.FLIP_LEFT_RIGHT,
+    'v': Image.Transpose.FLIP_TOP_BOTTOM,
+    'vertical': Image.Transpose.FLIP_TOP_BOTTOM,
+    'both': Image.Transpose.ROTATE_180,
+}
+
+
+def read_orientation(img):
+    """EXIF orientation from the already parsed header (1 = upright)"""
+    # PNG: getexif() wuerde das ganze Bild laden, nur einen eXIf-Block im Kopf auswerten
+    if img.format == 'PNG':
+        exif = Image.Exif()
+        if 'exif' in img.info:
+            exif.load(img.info['exif'])
+    else:
+        exif = img.getexif()
+    orientation = exif.get(EXIF_ORIENTATION, 1)
+    return orientation if orientation in ORIENTATION_TRANSPOSE else 1
+
+
+@functools.lru_cache(maxsize=None)
+def compose_transpose(orientation, mirror_type):
+    """Orientation followed by mirroring as a single transpose op (None = unchanged)
+    
+    Drehungen und Spiegelungen bilden eine Gruppe mit 8 Elementen; das Ergebnis wird
+    an einem kleinen Probebild abgelesen, statt das Bild zweimal umzukopieren.
+    """
+    steps = [op for op in (ORIENTATION_TRANSPOSE.get(orientation), MIRROR_TRANSPOSE.get(mirror_type))
+             if op is not None]
+    if len(steps) < 2:
+        return steps[0] if steps else None
+    probe = Image.frombytes('L', (3, 2), bytes(range(6)))
+    expected = probe.transpose(steps[0]).transpose(steps[1])
+    if expected.tobytes() == probe.tobytes():
+        return None
+    for op in Image.Transpose:
+        candidate = probe.transpose(op)
+        if candidate.size == expected.size and candidate.tobytes() == expected.tobytes():
+            return op
+    raise ValueError(f"no transpose for orientation {orientation} + mirror {mirror_type}")
+
+
+# Marker in entropiekodierten Daten: FF gefolgt von etwas anderem als 00 (Stuffing) oder RST0-7
+JPEG_DATA_MARKER = re.compile(rb'\xff[^\x00\xd0-\xd7\xff]')
+
+
+def has_jpeg_end_marker(path):
+    """Walk the JPEG segments of the main image and check that its scan data ends with EOI
+    
+    Segmente mit Laengenfeld (APP1 mit EXIF-Vorschaubild, Kommentare) werden uebersprungen,
+    damit das FF D9 eines eingebetteten JPEGs nicht zaehlt. Angehaengte Daten hinter dem
+    EOI (Motion-Photo-Video, Hersteller-Trailer) sind erlaubt.
+    """
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if data[:2] != b'\xff\xd8':
+                return False
+            position = 2
+            while position + 2 <= len(data):
+                if data[position] != 0xFF:
+                    return False
+                marker = data[position + 1]
+                if marker == 0xFF:  # Fuellbytes vor einem Marker
+                    position += 1
+                    continue
+                if marker == 0xD9:
+                    return True
+                if 0xD0 <= marker <= 0xD7 or marker == 0x01:  # Marker ohne Laengenfeld
+                    position += 2
+                    continue
+                position += 2 + int.from_bytes(data[position + 2:position + 4], 'big')
+                if marker == 0xDA:
+                    # Scan-Daten bis zum naechsten echten Marker (progressive JPEGs: weitere Scans)
+                    match = JPEG_DATA_MARKER.search(data, position)
+                    if not match:
+                        return False
+                    position = match.start()
+    return False
+
+
+def preflight_image(image_ref):
+    """Cheap check of one input page: header, size, mode, DPI, EXIF orientation, problems
+    
+    Es wird nichts dekodiert; defekte Dateien werden mit corrupt=True markiert.
+    """
+    path, page_index = split_page_ref(image_ref)
+    info = {'path': image_ref, 'format': None, 'width': None, 'height': None, 'mode': None,
+            'dpi': None, 'orientation': 1, 'corrupt': False, 'problems': []}
+    try:
+        if path.lower().endswith('.pdf'):
+            if not PDF_INPUT_AVAILABLE:
+                raise RuntimeError("PDF input requires pypdfium2 (pip install pypdfium2)")
+            import pypdfium2 as pdfium
+            pdf = pdfium.PdfDocument(path)
+            try:
+                width_pt, height_pt = pdf.get_page_size(page_index or 0)
+            finally:
+                pdf.close()
+            info.update(format='PDF', mode='RGB', dpi=PDF_RENDER_DPI,
+                        width=round(width_pt / 72 * PDF_RENDER_DPI),
+                        height=round(height_pt / 72 * PDF_RENDER_DPI))
+        else:
+            with Image.open(path) as img:
+                if page_index:
+                    img.seek(page_index)
+                info.update(format=img.format, width=img.width, height=img.height, mode=img.mode,
+                            dpi=img.info.get('dpi'), orientation=read_orientation(img))
+                img.verify()  # Struktur/Pruefsummen, ohne zu dekodieren
+            if info['format'] == 'JPEG' and not has_jpeg_end_marker(path):
+                raise ValueError("truncated JPEG (no end marker)")
+    except Exception as e:
+        info['corrupt'] = True
+        info['problems'].append(f"unreadable: {e}")
+        return info
+    
+    width, height = info['width'], info['height']
+    if Image.MAX_IMAGE_PIXELS and width * height > Image.MAX_IMAGE_PIXELS:
+        info['problems'].append(f"oversized: {width}x{height} px")
+    print_dpi = max(width, height) / (PREFLIGHT_PRINT_SIDE_CM / 2.54)
+    if print_dpi < PREFLIGHT_MIN_DPI:
+        info['problems'].append(f"low resolution: about {print_dpi:.0f} dpi on A4")
+    return info
+
+
+class ExportCache:
+    """Cache for prepared export pages, keyed by source hash and transform parameters"""
+
+    def __init__(self, max_bytes=512 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # {key: (page, groesse)}
+        self._source_hashes = {}  # {pfad: (groesse, mtime_ns, digest)}
+        self._lock = threading.Lock()  # Zugriff aus Export- und Druck-Threads
+
+    def source_hash(self, image_path):
+        """Inhalts-Hash der Quelldatei (nur neu berechnen wenn Groesse/mtime sich aendern)"""
+        path, page_index = split_page_ref(image_path)
+        stat = os.stat(path)
+        known = self._source_hashes.get(path)
+        if known and known[0] == stat.st_size and known[1] == stat.st_mtime_ns:
+            digest = known[2]
+        else:
+            digest = hashlib.blake2b(digest_size=16)
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(chunk)
+            digest = digest.hexdigest()
+            self._source_hashes[path] = (stat.st_size, stat.st_mtime_ns, digest)
+        return digest if page_index is None else f"{digest}{PAGE_SEPARATOR}{page_index + 1}"
+
+    def contains(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, page, size):
+        """Seite speichern, aelteste Eintraege verwerfen wenn Budget ueberschritten"""
+        with self._lock:
+            if key in self._entries:
+                self.current_bytes -= self._entries.pop(key)[1]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (page, size)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes and self._entries:
+                _, (_, old_size) = self._entries.popitem(last=False)
+                self.current_bytes -= old_size
+
+    def set_max_bytes(self, max_bytes):
+        """Budget aendern (Ressourcen-Governor), ueberzaehlige Eintraege sofort verwerfen"""
+        with self._lock:
+            self.max_bytes = max_bytes
+            while self.current_bytes > self.max_bytes and self._entries:
+                _, (_, old_size) = self._entries.popitem(last=False)
+                self.current_bytes -= old_size
+
+    def entries(self, keys):
+        """Vorhandene Eintraege zu keys als {key: (seite, groesse)} (ohne Trefferstatistik)"""
+        with self._lock:
+            return {key: self._entries[key] for key in keys if key in self._entries}
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+
+# Speicherdruck-Stufen und die zugehoerigen Grenzen fuer Caches und Worker
+MB = 1024 * 1024
+RESOURCE_LIMITS = {
+    'normal': {'export_cache': 512 * MB, 'thumbnails': 500, 'previews': 20, 'workers': 1.0, 'window': 2},
+    'tight': {'export_cache': 128 * MB, 'thumbnails': 200, 'previews': 8, 'workers': 0.5, 'window': 1},
+    'critical': {'export_cache': 32 * MB, 'thumbnails': 100, 'previews': 2, 'workers': 0.0, 'window': 1},
+}
+
+
+class ResourceGovernor:
+    """Samples process RSS and system memory in a background thread and reports pressure changes"""
+
+    def __init__(self, on_change, interval=2.0, tight_fraction=0.20, critical_fraction=0.10,
+                 rss_fraction=0.5):
+        self.on_change = on_change  # wird im Governor-Thread aufgerufen: on_change(stufe, messung)
+        self.interval = interval
+        self.tight_fraction = tight_fraction  # verfuegbarer Anteil des Systemspeichers
+        self.critical_fraction = critical_fraction
+        self.rss_fraction = rss_fraction  # Anteil des Systemspeichers fuer den eigenen Prozess
+        self.level = 'normal'
+        self.last = None  # letzte Messung
+        self.thread = None
+
+    @staticmethod
+    def read_memory():
+        """(rss, available, total) in bytes; None where the platform gives no numbers"""
+        rss = available = total = None
+        try:
+            with open('/proc/self/statm') as f:
+                rss = int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+            with open('/proc/meminfo') as f:
+                meminfo = {line.split(':')[0]: int(line.split()[1]) * 1024 for line in f}
+            available = meminfo.get('MemAvailable')
+            total = meminfo.get('MemTotal')
+        except (OSError, ValueError, IndexError, AttributeError):
+            pass
+        if rss is None:
+            try:
+                import resource
+                # Spitzenwert (kein aktueller Wert verfuegbar); macOS in Bytes, sonst in KB
+                rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+                rss *= 1 if sys.platform == 'darwin' else 1024
+            except ImportError:
+                pass
+        return rss, available, total
+
+    def classify(self, rss, available, total):
+        if not total:
+            return 'normal'
+        level = 'normal'
+        if available is not None and available < total * self.critical_fraction:
+            return 'critical'
+        if available is not None and available < total * self.tight_fraction:
+            level = 'tight'
+        if rss and rss > total * self.rss_fraction:
+            level = 'tight'
+        return level
+
+    def sample(self):
+        rss, available, total = self.read_memory()
+        level = self.classify(rss, available, total)
+        self.last = {'rss': rss, 'available': available, 'total': total, 'level': level}
+        if level != self.level:
+            self.level = level
+            self.on_change(level, self.last)
+        return self.last
+
+    def start(self):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, daemon=True)
+            self.thread.start()
+
+    def run(self):
+        while True:
+            self.sample()
+            time.sleep(self.interval)
+
+
+# Inhaltsklassen fuer die Kodierung im PDF
+GRAY_SATURATION_LIMIT = 40  # Saettigung ab der ein Pixel als farbig gilt
+GRAY_COLOR_FRACTION = 0.005  # Anteil farbiger Pixel, bis zu dem ein Bild als grau gilt
+BILEVEL_MIDTONE_FRACTION = 0.06  # Anteil Mitteltoene, bis zu dem ein Bild als Schwarz/Weiss gilt
+BILEVEL_TONES = (32, 224)  # Mitteltoene: alles zwischen fast schwarz und fast weiss
+BILEVEL_INK_LIMIT = BILEVEL_TONES[0]  # dunkler gilt als Tinte
+BILEVEL_PAPER_SHARE = 0.01  # Tonwerte mit mind. diesem Anteil am Papierweiss-Maximum gehoeren zum Papier (Rauschen)
+BILEVEL_FLAT_FRACTION = 0.001  # Anteil flacher Grauflaechen (Schattierung, Bleistift, Marker), ab dem Graustufen noetig sind
+BILEVEL_FLAT_RANGE = 24  # max. Helligkeitsspanne im 3x3-Umfeld einer flachen Flaeche
+BILEVEL_SAMPLE_SIDE = 1000  # Kantenlaenge der Kopie fuer die Flaechenpruefung
+
+
+def paper_tones(histogram):
+    """Lowest tone of the paper-white peak: from the brightest maximum down while the tones are common"""
+    paper = max(range(128, 256), key=lambda v: histogram[v])
+    limit = histogram[paper] * BILEVEL_PAPER_SHARE
+    low = paper
+    while low > 128 and histogram[low - 1] > limit:
+        low -= 1
+    return low
+
+
+def classify_image_content(img):
+    """Classify an export image as 'photo', 'gray' or 'bilevel' (text scan)"""
+    if img.mode not in ('RGB', 'L'):
+        img = img.convert('RGB')
+    if img.mode == 'RGB':
+        # Farbanteil auf einer verkleinerten Kopie bestimmen
+        sample = img.reduce(max(1, max(img.size) // 256))
+        saturation = sample.convert('HSV').getchannel('S').histogram()
+        colored = sum(saturation[GRAY_SATURATION_LIMIT:])
+        if colored > GRAY_COLOR_FRACTION * sample.width * sample.height:
+            return 'photo'
+        img = img.convert('L')
+    # Mitteltoene in voller Aufloesung zaehlen (Kanten von Schrift bleiben scharf)
+    histogram = img.histogram()
+    midtones = sum(histogram[BILEVEL_TONES[0]:BILEVEL_TONES[1]])
+    if midtones > BILEVEL_MIDTONE_FRACTION * img.width * img.height:
+        return 'gray'
+    # Kleine helle Grauflaechen wuerde die 1-Bit-Schwelle weiss machen; anders als Schriftkanten
+    # sind sie im 3x3-Umfeld flach. Grau ist alles zwischen Tinte und dem Papierweiss dieser Seite
+    # (auch helle Toene bis knapp unter das Papier, nicht nur bis zu einer festen Grenze).
+    from PIL import ImageFilter
+    sample = img.reduce(max(1, max(img.size) // BILEVEL_SAMPLE_SIDE))
+    paper = paper_tones(sample.histogram())
+    spread = ImageChops.difference(sample.filter(ImageFilter.MaxFilter(3)),
+                                   sample.filter(ImageFilter.MinFilter(3)))
+    flat = ImageChops.multiply(
+        spread.point([255 if v < BILEVEL_FLAT_RANGE else 0 for v in range(256)]),
+        sample.point([255 if BILEVEL_INK_LIMIT <= v < paper else 0 for v in range(256)]))
+    if flat.histogram()[255] > BILEVEL_FLAT_FRACTION * sample.width * sample.height:
+        return 'gray'
+    return 'bilevel'
+
+
+def encode_pdf_image(img, name, content=None, jpeg_quality=90):
+    """Encode image once as PDF image XObject (reusable across canvases)
+    
+    content: None = verlustfrei RGB (reportlab), 'photo' = DCT/JPEG,
+             'gray' = 8-bit Graustufen Flate, 'bilevel' = 1-bit Flate
+    """
+    from reportlab.pdfbase import pdfdoc
+    from reportlab.lib.utils import ImageReader
+    if content is None:
+        return pdfdoc.PDFImageXObject(name, ImageReader(img))
+    xobject = pdfdoc.PDFImageXObject(name)
+    xobject.width, xobject.height = img.size
+    xobject.bitsPerComponent = 8
+    xobject.mask = None
+    if content == 'photo':
+        data = io.BytesIO()
+        img.convert('RGB').save(data, format='JPEG', quality=jpeg_quality)
+        xobject.colorSpace = 'DeviceRGB'
+        xobject._filters = ('DCTDecode',)
+        xobject.streamContent = data.getvalue()
+        return xobject
+    gray = img.convert('L')
+    xobject.colorSpace = 'DeviceGray'
+    xobject._filters = ('FlateDecode',)
+    if content == 'bilevel':
+        # PIL '1' packt 8 Pixel pro Byte, Zeilen auf Byte-Grenze, 1 = weiss wie in PDF
+        gray = gray.point(lambda v: 255 if v >= 128 else 0).convert('1', dither=Image.Dither.NONE)
+        xobject.bitsPerComponent = 1
+    xobject.streamContent = zlib.compress(gray.tobytes())
+    return xobject
+
+
+# Farbmanagement: Bilder mit eingebettetem ICC-Profil nach sRGB umrechnen
+COLOR_INTENT = 0  # ImageCms.Intent.PERCEPTUAL
+
+
+class ColorManager:
+    """ICC conversion to sRGB; each transform is built once per (source profile, modes, intent)"""
+
+    def __init__(self, intent=COLOR_INTENT):
+        self.intent = intent
+        self.built = 0
+        self._target = None
+        self._transforms = {}  # {(profil-bytes, eingabemodus, ausgabemodus, intent): transform}
+        self._lock = threading.Lock()
+
+    def transform_for(self, icc_profile, in_mode, out_mode):
+        from PIL import ImageCms
+        
+        key = (icc_profile, in_mode, out_mode, self.intent)
+        with self._lock:
+            transform = self._transforms.get(key)
+            if transform is None:
+                if self._target is None:
+                    self._target = ImageCms.createProfile('sRGB')
+                source = ImageCms.ImageCmsProfile(io.BytesIO(icc_profile))
+                transform = ImageCms.buildTransform(source, self._target, in_mode, out_mode,
+                                                    renderingIntent=self.intent)
+                self._transforms[key] = transform
+                self.built += 1
+        return transform
+
+    def to_srgb(self, img):
+        """Convert an image with embedded profile to sRGB (others are returned unchanged)"""
+        from PIL import ImageCms
+        
+        icc_profile = img.info.get('icc_profile')
+        if not icc_profile or img.mode not in ('RGB', 'RGBA', 'CMYK'):
+            return img
+        out_mode = 'RGBA' if img.mode == 'RGBA' else 'RGB'
+        return ImageCms.applyTransform(img, self.transform_for(icc_profile, img.mode, out_mode))
+
+
+def draw_encoded_image(c, xobject, x, y, width, height):
+    """Draw pre-encoded image XObject into canvas without re-encoding"""
+    doc = c._doc
+    reg_name = doc.getXObjectName(xobject.name)
+    if doc.idToObject.get(reg_name) is None:
+        # Flache Kopie je Dokument, die kodierten Daten werden geteilt
+        xobject = copy.copy(xobject)
+        xobject.__dict__.pop('__InternalName__', None)
+        c._setXObjects(xobject)
+        doc.Reference(xobject, reg_name)
+        doc.addForm(xobject.name, xobject)
+    c._currentPageHasImages = 1
+    c.saveState()
+    c.translate(x, y)
+    c.scale(width, height)
+    c._code.append("/%s Do" % reg_name)
+    c.restoreState()
+    c._formsinuse.append(xobject.name)
+
+
+class PrintSpooler:
+    """Submit PDF print jobs directly to CUPS (lp, fallback lpr) and track their status"""
+
+    def __init__(self, printer=None, duplex=True):
+        self.printer = printer
+        self.duplex = duplex
+
+    @staticmethod
+    def available():
+        return sys.platform != 'win32' and bool(shutil.which('lp') or shutil.which('lpr'))
+
+    def describe(self):
+        """Druckziel fuer Rueckfragen im UI"""
+        return f"printer '{self.printer}'" if self.printer else "the default printer"
+
+    def submit(self, pdf_path, title, duplex=None):
+        """Spool a PDF and return the job id (None if the backend reports none)
+        
+        duplex: ueberschreibt die Voreinstellung fuer diesen Auftrag (z.B. einseitige Einzelbilder)
+        """
+        duplex = self.duplex if duplex is None else duplex
+        sides = 'two-sided-long-edge' if duplex else 'one-sided'
+        if shutil.which('lp'):
+            cmd = ['lp', '-o', f'sides={sides}', '-t', title]
+            if self.printer:
+                cmd += ['-d', self.printer]
+        else:
+            cmd = ['lpr', '-o', f'sides={sides}', '-T', title]
+            if self.printer:
+                cmd += ['-P', self.printer]
+        result = subprocess.run(cmd + [pdf_path], capture_output=True, text=True, check=True)
+        # lp: "request id is Drucker-123 (1 file(s))"
+        match = re.search(r'request id is (\S+)', result.stdout)
+        return match.group(1) if match else None
+
+    def job_status(self, job_id):
+        """'pending' while CUPS still lists the job, otherwise 'completed'"""
+        if job_id is None:
+            # lpr liefert keine Auftragsnummer
+            return 'untracked'
+        result = subprocess.run(['lpstat', '-W', 'not-completed', '-o'],
+                                capture_output=True, text=True)
+        return 'pending' if job_id in result.stdout.split() else 'completed'
+
+
+class FakeSpooler(PrintSpooler):
+    """Local spooler for testing: copies each job into a directory instead of printing"""
+
+    def __init__(self, spool_dir, duplex=True):
+        super().__init__(duplex=duplex)
+        self.spool_dir = spool_dir
+        self.job_count = 0
+        os.makedirs(spool_dir, exist_ok=True)
+
+    @staticmethod
+    def available():
+        return True
+
+    def submit(self, pdf_path, title, duplex=None):
+        self.job_count += 1
+        job_id = f"fake-{self.job_count}"
+        shutil.copyfile(pdf_path, os.path.join(self.spool_dir, f"{job_id}.pdf"))
+        return job_id
+
+    def job_status(self, job_id):
+        return 'completed'
+
+    def describe(self):
+        return f"the test spool folder {self.spool_dir}"
+
+
+DEFAULT_LOG_FILE = os.path.join(Path.home(), '.druckmgr', 'druckmgr.log')
+
+
+class DebugLog:
+    """Bounded debug log: ring buffer, batched UI output and optional rotating log file"""
+
+    LEVELS = {'DEBUG': logging.DEBUG, 'INFO': logging.INFO, 'WARNING': logging.WARNING,
+              'ERROR': logging.ERROR}
+
+    def __init__(self, max_lines=2000, level='DEBUG'):
+        self.max_lines = max_lines
+        self.level = level
+        self.lines = deque(maxlen=max_lines)  # letzte Zeilen (Ringpuffer)
+        self.pending = deque(maxlen=max_lines)  # noch nicht angezeigt
+        self.logger = logging.getLogger('druckmgr')
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+        self.file_handler = None
+
+    def add(self, message, level='DEBUG'):
+        """Zeile aufnehmen (deque.append ist thread-sicher)"""
+        if self.LEVELS.get(level, logging.DEBUG) < self.LEVELS[self.level]:
+            return
+        line = f"[{level}] {message}"
+        self.lines.append(line)
+        self.pending.append(line)
+        if self.file_handler:
+            self.logger.log(self.LEVELS.get(level, logging.DEBUG), message)
+
+    def take_pending(self):
+        """Alle noch nicht angezeigten Zeilen abholen"""
+        lines = []
+        while self.pending:
+            try:
+                lines.append(self.pending.popleft())
+            except IndexError:
+                break
+        return lines
+
+    def enable_file(self, path, max_bytes=1024 * 1024, backup_count=3):
+        """Also write to a rotating log file"""
+        self.disable_file()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.file_handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8')
+        self.file_handler.setFormatter(logging.Formatter('%(asctime)s [%(levelname)s] %(message)s'))
+        self.logger.addHandler(self.file_handler)
+        return path
+
+    def disable_file(self):
+        if self.file_handler:
+            self.logger.removeHandler(self.file_handler)
+            self.file_handler.close()
+            self.file_handler = None
+
+
+class PdfExportWriter:
+    """PDF writer for the export pipeline: one PDF page per page plan entry"""
+
+    def __init__(self, app, filename, settings):
+        from reportlab.lib.pagesizes import A4, landscape
+        from reportlab.lib.units import cm
+        from reportlab.pdfgen import canvas
+        
+        self.app = app
+        self.filename = filename
+        self.settings = settings
+        self.cm = cm
+        # PDF Seitenformat (Standard: Hochformat)
+        self.page_size = landscape(A4) if settings['landscape'] else A4
+        # Reproduzierbar: feste Zeitstempel, Dokument-ID aus den Inhalts-Hashes der Seiten
+        self.canvas = canvas.Canvas(filename, pagesize=self.page_size,
+                                    invariant=1 if settings.get('reproducible') else None)
+        self.page_width_cm = 29.7 if settings['landscape'] else 21.0
+        self.page_height_cm = 21.0 if settings['landscape'] else 29.7
+        app.log_debug(f"Creating PDF: {filename}")
+
+    def needs_image(self, page):
+        # Seiten aus dem Export-Cache brauchen kein dekodiertes Bild
+        key = self.app.pdf_page_key(page, self.settings, self.page_width_cm, self.page_height_cm)
+        return not self.app.export_cache.contains(key)
+
+    def add_page(self, page_number, page, base_img):
+        cm = self.cm
+        if page:
+            side_name = "Front" if page['side'] == 'front' else "Back"
+            prepared = self.app.prepare_pdf_page(page, self.settings, self.page_width_cm,
+                                                 self.page_height_cm, base_img=base_img)
+            self.canvas._doc.updateSignature(prepared['xobject'].name)
+            img_width = prepared['width_cm'] * cm
+            img_height = prepared['height_cm'] * cm
+            
+            # Zentrieren
+            width, height = self.page_size
+            x = (width - img_width) / 2
+            y = (height - img_height) / 2
+            
+            draw_encoded_image(self.canvas, prepared['xobject'], x, y, img_width, img_height)
+            self.app.log_debug(f"{side_name} {page['pair_index'] + 1} added: "
+                               f"{img_width/cm:.2f} x {img_height/cm:.2f} cm")
+        else:
+            self.canvas._doc.updateSignature(f"blank {page_number}")
+            if page_number % 2 == 1:
+                self.app.log_debug(f"Back {page_number // 2 + 1} is empty")
+        self.canvas.showPage()
+
+    def abort(self):
+        # Canvas schreibt erst beim Speichern; nur eine eventuell vorhandene Datei entfernen
+        self.canvas = None
+        with contextlib.suppress(OSError):
+            os.remove(self.filename)
+
+    def close(self):
+        self.canvas.save()
+        cache = self.app.export_cache
+        self.app.log_debug(f"PDF saved: {self.filename} (pages reused: {cache.hits}, "
+                           f"rendered: {cache.misses})")
+
+
+# DOCX-Paketteile (minimales WordprocessingML, Layout wie die bisherige python-docx Vorlage)
+DOCX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Default Extension="png" ContentType="image/png"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '<Override PartName="/word/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>'
+    '</Types>'
+)
+DOCX_PACKAGE_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/'
+    'officeDocument" Target="word/document.xml"/>'
+    '</Relationships>'
+)
+DOCX_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<w:styles xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    '<w:docDefaults><w:rPrDefault><w:rPr><w:rFonts w:ascii="Calibri" w:hAnsi="Calibri" w:cs="Calibri"/>'
+    '<w:sz w:val="22"/><w:szCs w:val="22"/><w:lang w:val="en-US"/></w:rPr></w:rPrDefault>'
+    '<w:pPrDefault><w:pPr><w:spacing w:after="200" w:line="276" w:lineRule="auto"/></w:pPr></w:pPrDefault>'
+    '</w:docDefaults>'
+    '<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/><w:qFormat/></w:style>'
+    '</w:styles>'
+)
+DOCX_DOCUMENT_START = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships" '
+    'xmlns:wp="http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing" '
+    'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+    'xmlns:pic="http://schemas.openxmlformats.org/drawingml/2006/picture"><w:body>'
+)
+DOCX_PICTURE = (
+    '<w:p><w:pPr><w:jc w:val="center"/></w:pPr><w:r><w:drawing><wp:inline>'
+    '<wp:extent cx="{cx}" cy="{cy}"/><wp:docPr id="{id}" name="Picture {id}"/>'
+    '<wp:cNvGraphicFramePr><a:graphicFrameLocks noChangeAspect="1"/></wp:cNvGraphicFramePr>'
+    '<a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/picture"><pic:pic>'
+    '<pic:nvPicPr><pic:cNvPr id="0" name="image.png"/><pic:cNvPicPr/></pic:nvPicPr>'
+    '<pic:blipFill><a:blip r:embed="{rid}"/><a:stretch><a:fillRect/></a:stretch></pic:blipFill>'
+    '<pic:spPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"/></pic:spPr></pic:pic></a:graphicData></a:graphic></wp:inline></w:drawing></w:r></w:p>'
+)
+DOCX_PAGE_BREAK = '<w:p><w:r><w:br w:type="page"/></w:r></w:p>'
+DOCX_TIMESTAMP = (1980, 1, 1, 0, 0, 0)  # feste Zeitstempel: gleiche Dokumente sind bytegleich
+DOCX_EMU_PER_CM = 360000
+DOCX_TWIPS_PER_CM = 1440 / 2.54
+
+
+class DocxExportWriter:
+    """Streaming Word writer: landscape A4, one centered picture per page
+    
+    Bilder werden sofort ins ZIP geschrieben, der Dokumenttext wird in einer
+    temporaeren Datei gesammelt; es wird nie ein komplettes Dokument im Speicher gehalten.
+    """
+
+    def __init__(self, app, filename, settings, page_count):
+        self.app = app
+        self.filename = filename
+        self.settings = settings
+        self.page_count = page_count
+        self.image_count = 0
+        # A4 im Querformat, damit 29.7 cm die Seitenbreite ist
+        self.page_width_cm = 29.7
+        self.page_height_cm = 21.0
+        self.available_width_cm = self.page_width_cm - 2 * settings['margin']
+        self.available_height_cm = self.page_height_cm - 2 * settings['margin']
+        self.body = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+        self.zip = zipfile.ZipFile(filename, 'w', zipfile.ZIP_DEFLATED)
+        self.zip.writestr(self.part_info('[Content_Types].xml'), DOCX_CONTENT_TYPES)
+        self.zip.writestr(self.part_info('_rels/.rels'), DOCX_PACKAGE_RELS)
+        self.zip.writestr(self.part_info('word/styles.xml'), DOCX_STYLES)
+        app.log_debug(f"Creating Word document: {filename}")
+
+    @staticmethod
+    def part_info(name, compress_type=zipfile.ZIP_DEFLATED):
+        """Zip entry with a fixed timestamp"""
+        info = zipfile.ZipInfo(name, date_time=DOCX_TIMESTAMP)
+        info.compress_type = compress_type
+        return info
+
+    def needs_image(self, page):
+        return True
+
+    def add_picture(self, base_img, width_cm, height_cm):
+        """Bild als Medienteil schreiben und Absatz mit Inline-Grafik anhaengen"""
+        self.image_count += 1
+        # PNG ist bereits komprimiert: ungepackt speichern, direkt in den ZIP-Eintrag kodieren
+        info = self.part_info(f'word/media/image{self.image_count}.png', zipfile.ZIP_STORED)
+        with self.zip.open(info, 'w') as media:
+            base_img.save(media, format='PNG')
+        self.body.write(DOCX_PICTURE.format(
+            cx=int(width_cm * DOCX_EMU_PER_CM), cy=int(height_cm * DOCX_EMU_PER_CM),
+            id=self.image_count, rid=f'rId{self.image_count}').encode('utf-8'))
+
+    def add_page(self, page_number, page, base_img):
+        is_back = page_number % 2 == 1
+        if page:
+            side_name = "Front" if page['side'] == 'front' else "Back"
+            base_img = self.app.color_convert(base_img, self.settings)
+            # Berechne korrekte Groesse wie im PDF
+            if self.settings['scale_to_width']:
+                img_width_cm, img_height_cm = self.app.compute_target_size_cm(
+                    base_img, self.available_width_cm, self.available_height_cm
+                )
+                self.add_picture(base_img, img_width_cm, img_height_cm)
+                self.app.log_debug(f"{side_name} {page['pair_index'] + 1} added: "
+                                   f"{img_width_cm:.2f} x {img_height_cm:.2f} cm")
+            else:
+                # Originalgroesse verwenden (auf Seitenbreite)
+                self.add_picture(base_img, self.available_width_cm,
+                                 self.available_width_cm * base_img.height / base_img.width)
+                self.app.log_debug(f"{side_name} {page['pair_index'] + 1} added (page width)")
+        elif is_back:
+            # Leere Seite wenn keine Rueckseite
+            self.body.write(b'<w:p><w:r><w:t>(No back side)</w:t></w:r></w:p>')
+            self.app.log_debug(f"Back {page_number // 2 + 1} is empty")
+        
+        # Seitenumbruch nach jeder Seite ausser der letzten (auch in der einseitigen Ausgabe)
+        if page_number < self.page_count - 1:
+            self.body.write(DOCX_PAGE_BREAK.encode('utf-8'))
+
+    def close(self):
+        margin = int(round(self.settings['margin'] * DOCX_TWIPS_PER_CM))
+        section = (
+            '<w:sectPr><w:pgSz w:w="{w}" w:h="{h}" w:orient="landscape"/>'
+            '<w:pgMar w:top="{m}" w:right="{m}" w:bottom="{m}" w:left="{m}" w:header="720" w:footer="720" w:gutter="0"/>'
+            '<w:cols w:space="720"/><w:docGrid w:linePitch="360"/></w:sectPr></w:body></w:document>'
+        ).format(w=int(round(self.page_width_cm * DOCX_TWIPS_PER_CM)),
+                 h=int(round(self.page_height_cm * DOCX_TWIPS_PER_CM)), m=margin)
+        with self.zip.open(self.part_info('word/document.xml'), 'w') as document:
+            document.write(DOCX_DOCUMENT_START.encode('utf-8'))
+            self.body.seek(0)
+            shutil.copyfileobj(self.body, document)
+            document.write(section.encode('utf-8'))
+        self.body.close()
+        
+        relationships = ''.join(
+            f'<Relationship Id="rId{n}" Type="http://schemas.openxmlformats.org/officeDocument/2006/'
+            f'relationships/image" Target="media/image{n}.png"/>'
+            for n in range(1, self.image_count + 1)
+        )
+        styles_rel = (f'<Relationship Id="rId{self.image_count + 1}" Type="http://schemas.openxmlformats.org/'
+                      f'officeDocument/2006/relationships/styles" Target="styles.xml"/>')
+        self.zip.writestr(self.part_info('word/_rels/document.xml.rels'),
+                          '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                          '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                          f'{relationships}{styles_rel}</Relationships>')
+        self.zip.close()
+        self.app.log_debug(f"Word document saved: {self.filename}")
+
+    def abort(self):
+        """Abgebrochener Export: offene Dateien schliessen, unvollstaendiges Dokument loeschen"""
+        self.body.close()
+        self.zip.close()
+        with contextlib.suppress(OSError):
+            os.remove(self.filename)
+
+
+class ImageExportWriter:
+    """Writes each prepared page as a separate PNG or JPEG file"""
+
+    def __init__(self, app, stem, image_format, settings):
+        self.app = app
+        self.stem = stem
+        self.image_format = image_format
+        self.settings = settings
+        self.extension = 'jpg' if image_format == 'JPEG' else 'png'
+        self.files = []
+
+    def needs_image(self, page):
+        return True
+
+    def add_page(self, page_number, page, base_img):
+        if not page:
+            return
+        filename = f"{self.stem}_{page['pair_index'] + 1:03d}_{page['side']}.{self.extension}"
+        base_img = self.app.color_convert(base_img, self.settings)
+        if self.image_format == 'JPEG':
+            base_img.convert('RGB').save(filename, format='JPEG', quality=self.settings['jpeg_quality'])
+        else:
+            base_img.save(filename, format='PNG')
+        self.files.append(filename)
+        self.app.log_debug(f"Page image saved: {filename}")
+
+    def close(self):
+        pass
+
+    def abort(self):
+        for filename in self.files:
+            with contextlib.suppress(OSError):
+                os.remove(filename)
+
+
+# Verteilter PDF-Export: Seitenbereiche (Shards) als Teil-PDFs rendern und zusammenfuegen
+SHARD_MIN_PAGES = 200  # darunter lohnt sich der Prozessstart nicht
+SHARD_POLL_INTERVAL = 0.5  # s
+SHARD_TIMEOUT = 600  # s ohne Fortschritt, bis ein fremd beanspruchter Shard als verloren gilt
+PDF_REF = re.compile(rb'(?<![\w.#/])(\d+) 0 R')
+
+_shard_app = None  # headless DruckManager je Worker-Prozess
+
+
+def render_shard(job_path):
+    """Einen beanspruchten Shard-Auftrag rendern (Teil-PDF bzw. Fehlerdatei schreiben)"""
+    import json
+    global _shard_app
+    
+    base = job_path[:job_path.index('.json')]
+    try:
+        with open(job_path, 'r', encoding='utf-8') as f:
+            job = json.load(f)
+        if _shard_app is None:
+            _shard_app = DruckManager(tk.Tcl(), headless=True)
+        _shard_app.render_pdf(base + '.pdf.tmp', job['pages'], job['settings'])
+        # Vorbereitete Seiten fuer den Export-Cache des Auftraggebers mitliefern
+        keys = [_shard_app.pdf_page_key_for(page, job['settings']) for page in job['pages'] if page]
+        write_shard_cache(base + '.cache.tmp', _shard_app.export_cache.entries(keys))
+        os.replace(base + '.cache.tmp', base + '.cache')
+        os.replace(base + '.pdf.tmp', base + '.pdf')
+    except Exception as e:
+        with open(base + '.error', 'w', encoding='utf-8') as f:
+            f.write(str(e))
+    finally:
+        os.remove(job_path)
+
+
+def write_shard_cache(path, entries):
+    """Vorbereitete PDF-Seiten eines Shards als JSON-Zeilen schreiben (kein Pickle: das
+    Shard-Verzeichnis kann von mehreren Rechnern beschreibbar sein)"""
+    import base64
+    import json
+    
+    with open(path, 'w', encoding='utf-8') as f:
+        for key, (prepared, size) in entries.items():
+            xobject = dict(prepared['xobject'].__dict__)
+            content = xobject.pop('streamContent')
+            xobject['text'] = isinstance(content, str)  # reportlab: ASCII85 als str
+            xobject['stream'] = base64.b64encode(content.encode('latin-1') if xobject['text'] else content).decode('ascii')
+            f.write(json.dumps({'key': list(key), 'size': size, 'xobject': xobject,
+                                'width_cm': prepared['width_cm'], 'height_cm': prepared['height_cm']}) + '\n')
+
+
+def read_shard_cache(path):
+    """Gegenstueck zu write_shard_cache: {key: (vorbereitete seite, groesse)}"""
+    import base64
+    import json
+    from reportlab.pdfbase import pdfdoc
+    
+    entries = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            entry = json.loads(line)
+            fields = entry['xobject']
+            content = base64.b64decode(fields.pop('stream'))
+            xobject = pdfdoc.PDFImageXObject(fields['name'])
+            xobject.streamContent = content.decode('latin-1') if fields.pop('text') else content
+            fields['_filters'] = tuple(fields['_filters'])
+            xobject.__dict__.update(fields)
+            entries[tuple(entry['key'])] = ({'xobject': xobject, 'width_cm': entry['width_cm'],
+                                             'height_cm': entry['height_cm']}, entry['size'])
+    return entries
+
+
+def claim_shard(queue_dir, job='job-*'):
+    """Naechsten offenen Shard per atomarem Umbenennen beanspruchen (None wenn keiner offen)"""
+    import platform
+    
+    for job_dir in sorted(Path(queue_dir).glob(job)):
+        for job_file in sorted(job_dir.glob('shard-*.json')):
+            claimed = f"{job_file}.{platform.node()}-{os.getpid()}"
+            try:
+                os.rename(job_file, claimed)
+            except OSError:
+                continue  # anderer Worker war schneller
+            return claimed
+    return None
+
+
+def run_shard_worker(queue_dir, drain=False, job='job-*'):
+    """Shards aus einem (gemeinsamen) Verzeichnis abarbeiten
+    
+    drain=True: beenden sobald nichts mehr offen ist (lokale Worker-Prozesse),
+    sonst dauerhaft warten (Worker auf anderen Rechnern, "--shard-worker DIR").
+    job: nur Auftraege mit diesem Namensmuster (lokale Worker: nur der eigene Auftrag).
+    """
+    done = 0
+    while True:
+        claimed = claim_shard(queue_dir, job)
+        if claimed:
+            render_shard(claimed)
+            done += 1
+        elif drain:
+            return done
+        else:
+            time.sleep(SHARD_POLL_INTERVAL)
+
+
+def read_pdf_objects(path):
+    """Objekte eines reportlab-PDFs (klassische xref-Tabelle) ohne die Streams zu dekodieren
+    
+    Liefert ({nummer: (offset, laenge)}, trailer-bytes).
+    """
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - 1024))
+        tail = f.read()
+        xref_start = int(re.search(rb'startxref\s+(\d+)', tail).group(1))
+        f.seek(xref_start)
+        xref = f.read(size - xref_start)
+    lines = xref.split(b'\n')
+    first, count = (int(value) for value in lines[1].split())
+    offsets = {}
+    for number, line in enumerate(lines[2:2 + count], start=first):
+        fields = line.split()
+        if len(fields) >= 3 and fields[2] == b'n':
+            offsets[number] = int(fields[0])
+    trailer = xref[xref.index(b'trailer'):]
+    # Objekt endet dort, wo das naechste (oder die xref-Tabelle) beginnt
+    ends = sorted(offsets.values()) + [xref_start]
+    spans = {number: (offset, ends[ends.index(offset) + 1] - offset) for number, offset in offsets.items()}
+    return spans, trailer
+
+
+def merge_pdf_parts(part_paths, filename):
+    """Teil-PDFs auf Objektebene zusammenfuegen: Seiten, Bilder und Inhalte werden
+    unveraendert kopiert, nur Objektnummern und der Seitenbaum werden neu geschrieben"""
+    pages_number, catalog_number = 1, 2
+    next_number = 3
+    offsets = {}
+    kids = []
+    ids = hashlib.md5()
+    with open(filename, 'wb') as out:
+        with open(part_paths[0], 'rb') as f:
+            out.write(f.readline() + f.readline())  # PDF-Kopf und Binaer-Kommentar
+        for part in part_paths:
+            spans, trailer = read_pdf_objects(part)
+            ids.update(trailer)
+            root = int(re.search(rb'/Root (\d+) 0 R', trailer).group(1))
+            info = re.search(rb'/Info (\d+) 0 R', trailer)
+            with open(part, 'rb') as f:
+                def read_object(number):
+                    offset, length = spans[number]
+                    f.seek(offset)
+                    return f.read(length)
+                
+                old_pages = int(re.search(rb'/Pages (\d+) 0 R', read_object(root)).group(1))
+                page_tree = read_object(old_pages)
+                skip = {root, old_pages}
+                skip.update(int(m.group(1)) for m in re.finditer(rb'/Outlines (\d+) 0 R', read_object(root)))
+                if info:
+                    skip.add(int(info.group(1)))
+                mapping = {old_pages: pages_number}
+                for number in sorted(spans):
+                    if number not in skip:
+                        mapping[number] = next_number
+                        next_number += 1
+                kids.extend(mapping[int(number)] for number in
+                            re.findall(rb'(\d+) 0 R', page_tree[page_tree.index(b'/Kids'):]))
+                
+                def renumber(match):
+                    return b'%d 0 R' % mapping[int(match.group(1))]
+                
+                for number in sorted(spans, key=lambda n: spans[n][0]):
+                    if number in skip:
+                        continue
+                    data = read_object(number)
+                    body = data[data.index(b'obj') + 3:]
+                    # Nur das Objekt-Dictionary umschreiben, Stream-Daten bleiben unberuehrt
+                    split = body.find(b'>>\nstream')
+                    head, rest = (body, b'') if split < 0 else (body[:split], body[split:])
+                    offsets[mapping[number]] = out.tell()
+                    out.write(b'%d 0 obj' % mapping[number] + PDF_REF.sub(renumber, head) + rest)
+        
+        offsets[pages_number] = out.tell()
+        out.write(b'%d 0 obj\n<<\n/Count %d /Kids [ %s ] /Type /Pages\n>>\nendobj\n' % (
+            pages_number, len(kids), b' '.join(b'%d 0 R' % kid for kid in kids)))
+        offsets[catalog_number] = out.tell()
+        out.write(b'%d 0 obj\n<<\n/PageMode /UseNone /Pages %d 0 R /Type /Catalog\n>>\nendobj\n' % (
+            catalog_number, pages_number))
+        xref_start = out.tell()
+        out.write(b'xref\n0 %d\n0000000000 65535 f \n' % next_number)
+        for number in range(1, next_number):
+            out.write(b'%010d 00000 n \n' % offsets[number])
+        doc_id = ids.hexdigest().encode('ascii')
+        out.write(b'trailer\n<<\n/ID [<%s><%s>]\n/Root %d 0 R\n/Size %d\n>>\nstartxref\n%d\n%%%%EOF\n' % (
+            doc_id, doc_id, catalog_number, next_number, xref_start))
+    return len(kids)
+
+
+# Endzustaende eines Druckauftrags
+PRINT_JOB_DONE = ('completed', 'untracked')
+
+
+# Paarbildungs-Strategien (Anzeigename -> Schluessel)
+PAIRING_STRATEGIES = {
+    "Sequential (1+2, 3+4, ...)": 'sequential',
+    "Interleaved (all fronts, then all backs)": 'interleaved',
+    "All fronts, then reversed backs": 'reversed_backs',
+    "Filename pattern (front/back markers)": 'filename',
+    "Similarity (size and image hash)": 'similarity',
+}
+
+# Paare mit nur einer Seite im Duplex-Druck (Anzeigename -> Schluessel)
+SINGLE_SIDED_MODES = {
+    "Blank back page": 'blank',
+    "Collect at end, back to back": 'back_to_back',
+    "Separate simplex file": 'simplex',
+}
+SIMPLEX_SUFFIX = '_simplex'  # Dateiname der einseitigen Ausgabe: <name>_simplex.<ext>
+
+
+def count_sheets(pages, simplex_pages=()):
+    """Blaetter fuer einen Duplex-Seitenplan plus einseitig gedruckte Seiten"""
+    return (len(pages) + 1) // 2 + len(simplex_pages)
+
+
+class HammingIndex:
+    """Nearest 64-bit hash by Hamming distance, lowest position on ties
+    
+    Gleiche Hashes (leere Seiten, Duplikate) kommen aus einem Dict; nahe Treffer (Abstand <= 3)
+    stimmen in mindestens einem der vier 16-Bit-Teile ueberein. Sonst werden alle Hashes auf
+    einmal verglichen: gepackt in einer grossen Ganzzahl (8 Byte pro Eintrag) laufen XOR und
+    Bitzaehlung (SWAR) in wenigen Ganzzahl-Operationen. Entfernte Eintraege werden markiert
+    und beim Umpacken ausgelassen, sobald ein Viertel entfernt ist.
+    """
+
+    NEAR_DISTANCE = 3  # Vier Teile: bis zu diesem Abstand findet die Teil-Suche garantiert alle
+    NEAR_CANDIDATES = 256  # mehr Kandidaten (viele gleiche Bilder): gepackt vergleichen
+
+    def __init__(self, hashes):
+        self.hashes = list(hashes)
+        self.same = {}  # {hash: [positionen]}, vorne abgearbeitete Eintraege werden uebersprungen
+        for position, value in enumerate(self.hashes):
+            self.same.setdefault(value, deque()).append(position)
+        self.parts = [{} for _ in range(4)]  # {16-Bit-Teil: [positionen]}
+        for position, value in enumerate(self.hashes):
+            for part, table in enumerate(self.parts):
+                table.setdefault((value >> (16 * part)) & 0xFFFF, []).append(position)
+        self.alive = list(range(len(self.hashes)))  # Positionen im gepackten Feld
+        self.removed = set()
+        self._pack()
+
+    def _pack(self):
+        self.alive = [position for position in self.alive if position not in self.removed]
+        count = len(self.alive)
+        self.packed = int.from_bytes(b''.join(self.hashes[p].to_bytes(8, 'big') for p in self.alive), 'big')
+        self.packed_removed = 0  # 0x80 im Abstandsbyte entfernter Eintraege
+        self.packed_removed_count = 0
+        self.repeat = int.from_bytes(b'\0\0\0\0\0\0\0\1' * count, 'big')
+        self.m1 = 0x5555555555555555 * self.repeat
+        self.m2 = 0x3333333333333333 * self.repeat
+        self.m4 = 0x0F0F0F0F0F0F0F0F * self.repeat
+        self.low = 0xFF * self.repeat
+
+    def __len__(self):
+        return len(self.hashes) - len(self.removed)
+
+    def remove(self, position):
+        self.removed.add(position)
+        slot = bisect.bisect_left(self.alive, position)
+        self.packed_removed |= 0x80 << (64 * (len(self.alive) - 1 - slot))
+        self.packed_removed_count += 1
+        if self.packed_removed_count * 4 >= len(self.alive):
+            self._pack()
+
+    def nearest(self, query):
+        """(position, distance) of the closest remaining hash; None if empty"""
+        if not len(self):
+            return None
+        same = self.same.get(query)
+        while same and same[0] in self.removed:
+            same.popleft()
+        if same:
+            return same[0], 0
+        lists = [table.get((query >> (16 * part)) & 0xFFFF, ()) for part, table in enumerate(self.parts)]
+        if sum(map(len, lists)) <= self.NEAR_CANDIDATES:
+            near = min((((query ^ self.hashes[p]).bit_count(), p) for positions in lists for p in positions
+                        if p not in self.removed), default=None)
+            if near and near[0] <= self.NEAR_DISTANCE:
+                return near[1], near[0]
+        x = self.packed ^ (query * self.repeat)
+        x -= (x >> 1) & self.m1
+        x = (x & self.m2) + ((x >> 2) & self.m2)
+        x = (x + (x >> 4)) & self.m4
+        x += x >> 8
+        x += x >> 16
+        x += x >> 32
+        distances = ((x & self.low) | self.packed_removed).to_bytes(8 * len(self.alive), 'big')[7::8]
+        distance = min(distances)
+        return self.alive[distances.index(distance)], distance
+
+
+class PairingEngine:
+    """Build front/back pairs from a list of image files"""
+
+    # Dateinamen wie "scan_0001_front.jpg", "foto-a.png", "brief_2.jpg"
+    DEFAULT_PATTERN = r'^(?P<key>.*?)[ _.-]+(?P<side>front|back|vorderseite|rueckseite|vorne|hinten|vs|rs|a|b|1|2)$'
+    FRONT_MARKERS = {'front', 'vorderseite', 'vorne', 'vs', 'a', '1'}
+
+    def __init__(self, pattern=None, max_workers=4):
+        self.pattern = re.compile(pattern or self.DEFAULT_PATTERN, re.IGNORECASE)
+        self.max_workers = max_workers
+        self._signatures = {}  # {pfad: (seitenverhaeltnis, dhash)}
+
+    def pair(self, image_files, strategy='sequential'):
+        """Return list of (front, back) tuples; back is None for single images"""
+        method = getattr(self, f"pair_{strategy}", None)
+        if method is None:
+            raise ValueError(f"Unknown pairing strategy: {strategy}")
+        return method(list(image_files))
+
+    def pair_sequential(self, files):
+        # Wenn ungerade Anzahl, letztes Bild als einzelnes Paar (Rueckseite leer)
+        return [(files[i], files[i + 1] if i + 1 < len(files) else None)
+                for i in range(0, len(files), 2)]
+
+    def pair_interleaved(self, files):
+        fronts, backs = self._split_halves(files)
+        return [(front, backs[i] if i < len(backs) else None) for i, front in enumerate(fronts)]
+
+    def pair_reversed_backs(self, files):
+        # Duplex-Scanner ohne Wendeeinheit: Rueckseiten-Stapel in umgekehrter Reihenfolge
+        fronts, backs = self._split_halves(files)
+        backs = backs[::-1]
+        return [(front, backs[i] if i < len(backs) else None) for i, front in enumerate(fronts)]
+
+    def pair_filename(self, files):
+        groups = OrderedDict()  # {schluessel: [vorderseite, rueckseite]}
+        singles = []
+        for path in files:
+            match = self.pattern.match(Path(path).stem)
+            if not match:
+                singles.append(path)
+                continue
+            slot = 0 if match.group('side').lower() in self.FRONT_MARKERS else 1
+            key = (str(Path(path).parent), match.group('key').lower())
+            group = groups.setdefault(key, [None, None])
+            if group[slot] is not None:
+                singles.append(path)
+            else:
+                group[slot] = path
+        pairs = []
+        for front, back in groups.values():
+            if front is None:
+                front, back = back, None
+            pairs.append((front, back))
+        # Bilder ohne Markierung in Ablage-Reihenfolge paaren
+        return pairs + self.pair_sequential(singles)
+
+    def pair_similarity(self, files):
+        """Pair each image with the unpaired image of the same format and closest image hash"""
+        signatures = self.compute_signatures(files)
+        # Nach Seitenverhaeltnis gruppieren, damit nur passende Formate verglichen werden
+        buckets = {}
+        for i, path in enumerate(files):
+            buckets.setdefault(signatures[path][0], []).append(i)
+        indexes = {aspect: HammingIndex(signatures[files[i]][1] for i in members)
+                   for aspect, members in buckets.items()}
+        slots = {i: n for members in buckets.values() for n, i in enumerate(members)}
+        paired = set()
+        pairs = []
+        cursor = 0  # naechstes ungepaartes Bild fuer Formate ohne Partner (waechst nur)
+
+        def take(i):
+            paired.add(i)
+            indexes[signatures[files[i]][0]].remove(slots[i])
+
+        for i, path in enumerate(files):
+            if i in paired:
+                continue
+            take(i)
+            aspect, dhash = signatures[path]
+            # Hamming-Abstand der Hashes, bei Gleichstand das naechstliegende Bild
+            nearest = indexes[aspect].nearest(dhash)
+            if nearest is not None:
+                best = buckets[aspect][nearest[0]]
+            else:
+                cursor = max(cursor, i + 1)
+                while cursor < len(files) and cursor in paired:
+                    cursor += 1
+                if cursor == len(files):
+                    pairs.append((path, None))
+                    continue
+                best = cursor
+            take(best)
+            pairs.append((path, files[best]))
+        return pairs
+
+    def compute_signatures(self, files):
+        """Seitenverhaeltnis und Differenz-Hash parallel berechnen (mit Cache)"""
+        missing = [f for f in dict.fromkeys(files) if f not in self._signatures]
+        if missing:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                for path, signature in zip(missing, pool.map(self.image_signature, missing)):
+                    self._signatures[path] = signature
+        return self._signatures
+
+    @staticmethod
+    def image_signature(image_path):
+        """(aspect ratio bucket, 64-bit dHash) from a reduced decode"""
+        try:
+            with open_image(image_path, pdf_dpi=72) as img:
+                width, height = img.size
+                # JPEG: nur 1/8 dekodieren
+                img.draft('L', (64, 64))
+                small = img.convert('L').resize((9, 8), Image.Resampling.BILINEAR)
+            pixels = list(small.getdata())
+        except Exception:
+            return (None, 0)
+        dhash = 0
+        for row in range(8):
+            for col in range(8):
+                dhash = (dhash << 1) | (pixels[row * 9 + col] > pixels[row * 9 + col + 1])
+        return (round(width / height, 2), dhash)
+
+    @staticmethod
+    def _split_halves(files):
+        half = (len(files) + 1) // 2
+        return files[:half], files[half:]
+
 
 class DruckManager:
-    def __init__(self, root):
+    def __init__(self, root, headless=False):
+        """headless: ohne Fenster (Dienstmodus), root ist dann ein tk.Tcl() Interpreter"""
         self.root = root
-        self.root.title("Print Manager - Double-Sided Image Printing")
-        self.root.geometry("1200x800")
+        self.headless = headless
+        if not headless:
+            self.root.title("Print Manager - Double-Sided Image Printing")
+            self.root.geometry("1200x800")
         
         # Variablen
         self.images = []  # Liste von (vorderseite, rueckseite) Tupeln
         self.image_mirrors = {}  # {(pair_index, 'front'/'back'): ('h'/'v'/'both'/'none')}
         self.current_pair_index = 0
-        self.debug_mode = tk.BooleanVar(value=False)
-        self.mirror_back = tk.BooleanVar(value=True)
-        self.margin = tk.DoubleVar(value=1.0)  # in cm
-        self.scale_to_width = tk.BooleanVar(value=True)
-        self.auto_open_export = tk.BooleanVar(value=True)  # Exportierte Dateien automatisch oeffnen
-        self.pdf_landscape = tk.BooleanVar(value=False)  # PDF im Querformat (default aus)
-        self.auto_trim = tk.BooleanVar(value=True)  # Weissen Rand automatisch entfernen
+        self.debug_mode = tk.BooleanVar(root, value=False)
+        self.mirror_back = tk.BooleanVar(root, value=True)
+        self.margin = tk.DoubleVar(root, value=1.0)  # in cm
+        self.scale_to_width = tk.BooleanVar(root, value=True)
+        self.auto_open_export = tk.BooleanVar(root, value=True)  # Exportierte Dateien automatisch oeffnen
+        self.pdf_landscape = tk.BooleanVar(root, value=False)  # PDF im Querformat (default aus)
+        self.direct_print = tk.BooleanVar(root, value=False)  # Direkt an CUPS senden (mit Rueckfrage)
+        self.print_chunk_sheets = 10  # Duplex-Blaetter pro Druckauftrag
+        self.print_jobs = []  # [{'id', 'sheets', 'status'}]
+        self.print_thread = None
+        self.auto_trim = tk.BooleanVar(root, value=True)  # Weissen Rand automatisch entfernen
+        self.pairing_mode = tk.StringVar(root, value=next(iter(PAIRING_STRATEGIES)))  # Paarbildung
+        self.pairing_engine = PairingEngine()
+        self.single_sided_mode = tk.StringVar(root, value=next(iter(SINGLE_SIDED_MODES)))  # Paare ohne Rueckseite
+        self.sheet_count_label = None
         self.target_width = 29.7  # cm (A4 Breite)
+        self.export_dpi = 300
+        self.image_encoding = tk.StringVar(root, value='auto')  # 'auto' (je Inhalt) oder 'lossless'
+        self.jpeg_quality = 90
+        self.export_workers = min(8, os.cpu_count() or 2)  # Threads fuer die Seitenvorbereitung
+        self.export_window_factor = 2  # vorbereitete Seiten im Speicher je Worker
+        self.export_formats = {  # Formate fuer "Save all formats"
+            'pdf': tk.BooleanVar(root, value=True),
+            'docx': tk.BooleanVar(root, value=True),
+            'png': tk.BooleanVar(root, value=False),
+            'jpeg': tk.BooleanVar(root, value=False),
+        }
+        self.export_cache = ExportCache()  # Vorbereitete PDF-Seiten fuer inkrementellen Re-Export
+        self.color_management = tk.BooleanVar(root, value=False)  # ICC-Profile nach sRGB umrechnen
+        self.reproducible_pdf = tk.BooleanVar(root, value=False)  # gleicher Auftrag -> gleiche Bytes
+        self.color_manager = ColorManager()
+        self.image_info = {}  # {bildreferenz: Ergebnis von preflight_image()}
+        self.preflight_window = None
+        self.shard_processes = os.cpu_count() or 1  # Prozesse fuer den verteilten PDF-Export
+        # Speicherdruck beobachten und Caches/Worker anpassen (Start in on_startup_complete)
+        self.default_workers = (self.export_workers, self.shard_processes)
+        self.resource_governor = ResourceGovernor(self.on_resource_level)
+        self.resource_label = None
         
         # Drag & Drop Variablen
         self.drag_start_index = None
@@ -59,10 +1480,47 @@ class DruckManager:
         self.image_drag_source = None  # (pair_index, 'front'/'back')
         self.image_dragging = False
         
+        # Kachel-Rendering (lazy, nach Sichtbarkeit)
+        self.tile_pending = {}  # {(pair_index, 'front'/'back'): (label, pfad, pair_frame)}
+        self.tile_render_queue = []
+        self.tile_render_job = None
+        self.tile_render_batch = 4  # Kacheln pro Tick
+        self.tile_placeholder = None
+        self.thumbnail_cache = OrderedDict()  # {(pfad, spiegelung): PhotoImage}
+        self.thumbnail_cache_size = 500
+        
+        # Grosse Vorschau (zweistufig, mit Vorausladen der Nachbarpaare)
+        self.preview_images = OrderedDict()  # {pfad: {'low': PIL, 'full': PIL}} ungespiegelt
+        self.preview_cache_size = 500  # Eintraege mit kleiner Version
+        self.preview_full_cache_size = 20  # davon mit scharfer Version
+        self.preview_futures = {}  # {pfad: Future} laufende/wartende Renderauftraege
+        self.preview_pool = None  # ThreadPoolExecutor, erst bei Bedarf
+        self.preview_poll_job = None
+        
+        # Geometrie-Index der Kacheln fuer Drag & Drop (wird bei Layout-Aenderung verworfen)
+        self.tile_frames = {}  # {pair_index: pair_frame}
+        self.tile_layout = None  # {'tops', 'bottoms', 'lefts', 'rights', 'indices'} relativ zu tile_scrollable
+        self.drag_feedback = None  # (from_index, to_index) der aktuellen Markierung
+        
+        # Mehrfachauswahl und Batch-Operationen (eine Aktualisierung pro Transaktion)
+        self.selected_pairs = set()
+        self.selection_anchor = None
+        self.batch_depth = 0
+        self.refresh_pending = set()  # {'previews', 'tiles'}
+        
         # Debug Ausgabe
         self.debug_text = None
-        
-        self.setup_ui()
+        self.startup_time = None
+        self.debug_log = DebugLog()
+        self.debug_enabled = False  # Spiegel von debug_mode, lesbar aus Worker-Threads
+        self.debug_mode.trace_add("write", lambda *args: self.on_debug_mode_changed())
+        self.log_flush_job = None
+        self.log_flush_interval = 200  # ms
+        self.log_level = tk.StringVar(root, value=self.debug_log.level)
+        self.log_to_file = tk.BooleanVar(root, value=False)
+        
+        if not headless:
+            self.setup_ui()
         self.log_debug("Anwendung gestartet")
         
     def setup_ui(self):
@@ -94,6 +1552,11 @@ class DruckManager:
         ttk.Button(left_frame, text="Clear all", 
                   command=self.clear_all).pack(pady=5)
         
+        # Paarbildung
+        ttk.Label(left_frame, text="Pairing:").pack(anchor=tk.W)
+        ttk.Combobox(left_frame, textvariable=self.pairing_mode, state="readonly",
+                     values=list(PAIRING_STRATEGIES)).pack(fill=tk.X, pady=5)
+        
         # Mitte - Vorschau
         middle_frame = ttk.LabelFrame(main_frame, text="Preview", padding="10")
         middle_frame.grid(row=0, column=1, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5)
@@ -138,13 +1601,11 @@ class DruckManager:
         scrollbar = ttk.Scrollbar(canvas_frame, orient="vertical", command=self.tile_canvas.yview)
         self.tile_scrollable = ttk.Frame(self.tile_canvas)
         
-        self.tile_scrollable.bind(
-            "<Configure>",
-            lambda e: self.tile_canvas.configure(scrollregion=self.tile_canvas.bbox("all"))
-        )
+        self.tile_scrollable.bind("<Configure>", self.on_tiles_configure)
         
         self.tile_canvas.create_window((0, 0), window=self.tile_scrollable, anchor="nw")
-        self.tile_canvas.configure(yscrollcommand=scrollbar.set)
+        self.tile_canvas.configure(yscrollcommand=lambda first, last: self.on_tile_scroll(scrollbar, first, last))
+        self.tile_canvas.bind("<Configure>", lambda e: self.schedule_tile_render())
         
         self.tile_canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
@@ -181,6 +1642,28 @@ class DruckManager:
         ttk.Checkbutton(settings_frame, text="PDF landscape (A4)", 
                        variable=self.pdf_landscape).pack(anchor=tk.W, pady=5)
         
+        # Paare ohne Rueckseite
+        single_frame = ttk.Frame(settings_frame)
+        single_frame.pack(fill=tk.X, pady=5)
+        ttk.Label(single_frame, text="Single-sided pairs:").pack(side=tk.LEFT, padx=5)
+        single_box = ttk.Combobox(single_frame, textvariable=self.single_sided_mode, state="readonly",
+                                  values=list(SINGLE_SIDED_MODES), width=30)
+        single_box.pack(side=tk.LEFT, padx=5)
+        single_box.bind("<<ComboboxSelected>>", lambda e: self.update_sheet_count())
+        
+        # PDF Bildkompression
+        ttk.Checkbutton(settings_frame, text="Compact PDF images (JPEG photos, gray/1-bit scans)", 
+                       variable=self.image_encoding, onvalue='auto',
+                       offvalue='lossless').pack(anchor=tk.W, pady=5)
+        
+        # Farbmanagement
+        ttk.Checkbutton(settings_frame, text="Color management (embedded ICC profiles to sRGB)", 
+                       variable=self.color_management).pack(anchor=tk.W, pady=5)
+        
+        # Reproduzierbare PDFs
+        ttk.Checkbutton(settings_frame, text="Reproducible PDF (identical job, identical file)", 
+                       variable=self.reproducible_pdf).pack(anchor=tk.W, pady=5)
+        
         # Debug
         ttk.Checkbutton(settings_frame, text="Enable debug output", 
                        variable=self.debug_mode, 
@@ -200,9 +1683,33 @@ class DruckManager:
                   command=self.export_pdf).pack(side=tk.LEFT, padx=5)
         ttk.Button(action_frame, text="Save as Word", 
                   command=self.export_word).pack(side=tk.LEFT, padx=5)
+        ttk.Button(action_frame, text="Save all formats", 
+                  command=self.export_multi).pack(side=tk.LEFT, padx=5)
+        for fmt, label in (('pdf', "PDF"), ('docx', "Word"), ('png', "PNG pages"), ('jpeg', "JPEG pages")):
+            ttk.Checkbutton(action_frame, text=label, 
+                           variable=self.export_formats[fmt]).pack(side=tk.LEFT)
+        ttk.Checkbutton(action_frame, text="Print directly (CUPS)", 
+                       variable=self.direct_print).pack(side=tk.LEFT, padx=5)
+        self.print_status_label = ttk.Label(action_frame, text="")
+        self.print_status_label.pack(side=tk.LEFT, padx=5)
+        self.sheet_count_label = ttk.Label(action_frame, text="")
+        self.sheet_count_label.pack(side=tk.RIGHT, padx=5)
         
         # Debug Ausgabe (versteckt standardmaessig)
         self.debug_frame = ttk.LabelFrame(main_frame, text="Debug output", padding="10")
+        log_options = ttk.Frame(self.debug_frame)
+        log_options.pack(fill=tk.X)
+        ttk.Label(log_options, text="Level:").pack(side=tk.LEFT, padx=5)
+        level_box = ttk.Combobox(log_options, textvariable=self.log_level, state="readonly",
+                                 values=list(DebugLog.LEVELS), width=10)
+        level_box.pack(side=tk.LEFT, padx=5)
+        level_box.bind("<<ComboboxSelected>>",
+                       lambda e: setattr(self.debug_log, 'level', self.log_level.get()))
+        ttk.Checkbutton(log_options, text=f"Write log file ({DEFAULT_LOG_FILE})",
+                       variable=self.log_to_file,
+                       command=self.toggle_log_file).pack(side=tk.LEFT, padx=5)
+        self.resource_label = ttk.Label(log_options, text="")
+        self.resource_label.pack(side=tk.RIGHT, padx=5)
         self.debug_text = scrolledtext.ScrolledText(self.debug_frame, height=8, width=100)
         self.debug_text.pack(fill=tk.BOTH, expand=True)
         self.debug_frame.grid_remove()
@@ -212,13 +1719,82 @@ class DruckManager:
         main_frame.columnconfigure(2, weight=1)
         main_frame.rowconfigure(0, weight=1)
         
-    def log_debug(self, message):
-        """Debug Nachricht ausgeben"""
-        if self.debug_mode.get() and self.debug_text:
-            self.debug_text.insert(tk.END, f"[DEBUG] {message}\n")
-            self.debug_text.see(tk.END)
-        if self.debug_mode.get():
-            print(f"[DEBUG] {message}")
+    def on_startup_complete(self, exit_after=False):
+        """Record time-to-interactive and pre-warm the exporter modules"""
+        self.startup_time = time.perf_counter() - STARTUP_T0
+        self.log_debug(f"Startup time: {self.startup_time * 1000:.0f} ms")
+        if exit_after:
+            print(f"Startup time: {self.startup_time * 1000:.0f} ms")
+            self.root.destroy()
+            return
+        threading.Thread(target=prewarm_exporters, daemon=True).start()
+        self.resource_governor.start()
+    
+    def log_debug(self, message, level='DEBUG'):
+        """Debug Nachricht ausgeben (thread-sicher, Anzeige gebuendelt per Timer)"""
+        if self.debug_enabled:
+            self.debug_log.add(message, level)
+    
+    def on_debug_mode_changed(self):
+        """Debug-Status fuer Worker-Threads spiegeln und Flush-Timer starten"""
+        self.debug_enabled = self.debug_mode.get()
+        if self.debug_enabled and self.log_flush_job is None:
+            self.log_flush_job = self.root.after(self.log_flush_interval, self.flush_debug_log)
+    
+    def flush_debug_log(self):
+        """Gesammelte Log-Zeilen in einem Schritt ins Widget schreiben"""
+        self.log_flush_job = None
+        lines = self.debug_log.take_pending()
+        if lines:
+            text = "\n".join(lines) + "\n"
+            print(text, end="")
+            if self.debug_text:
+                self.debug_text.insert(tk.END, text)
+                # Widget auf max_lines Zeilen begrenzen
+                line_count = int(self.debug_text.index("end-1c").split(".")[0]) - 1
+                excess = line_count - self.debug_log.max_lines
+                if excess > 0:
+                    self.debug_text.delete("1.0", f"{excess + 1}.0")
+                self.debug_text.see(tk.END)
+        self.update_resource_status()
+        if self.debug_enabled:
+            self.log_flush_job = self.root.after(self.log_flush_interval, self.flush_debug_log)
+    
+    def on_resource_level(self, level, sample):
+        """Caches und Worker an den Speicherdruck anpassen (laeuft im Governor-Thread, kein Tk)"""
+        limits = RESOURCE_LIMITS[level]
+        self.export_cache.set_max_bytes(limits['export_cache'])
+        self.thumbnail_cache_size = limits['thumbnails']  # wird beim naechsten Rendern gekuerzt
+        self.preview_full_cache_size = limits['previews']
+        export_workers, shard_processes = self.default_workers
+        self.export_workers = max(1, int(export_workers * limits['workers']))
+        self.shard_processes = max(1, int(shard_processes * limits['workers']))
+        self.export_window_factor = limits['window']
+        self.log_debug(f"Memory {level}: RSS {(sample['rss'] or 0) / MB:.0f} MB, "
+                       f"available {(sample['available'] or 0) / MB:.0f} MB -> "
+                       f"{self.export_workers} workers, export cache {limits['export_cache'] // MB} MB",
+                       'WARNING' if level != 'normal' else 'INFO')
+    
+    def update_resource_status(self):
+        """Aktuelle Speichernutzung im Debug-Bereich anzeigen"""
+        sample = self.resource_governor.last
+        if self.resource_label is None or sample is None:
+            return
+        text = f"RSS {(sample['rss'] or 0) / MB:.0f} MB"
+        if sample['total']:
+            text += f", available {sample['available'] / MB:.0f} of {sample['total'] / MB:.0f} MB"
+        text += (f" ({sample['level']}) | workers {self.export_workers} | "
+                 f"export cache {self.export_cache.current_bytes / MB:.0f}/{self.export_cache.max_bytes / MB:.0f} MB | "
+                 f"thumbnails {len(self.thumbnail_cache)}/{self.thumbnail_cache_size}")
+        self.resource_label.config(text=text)
+    
+    def toggle_log_file(self):
+        """Log-Datei (rotierend) ein/ausschalten"""
+        if self.log_to_file.get():
+            path = self.debug_log.enable_file(DEFAULT_LOG_FILE)
+            self.log_debug(f"Logging to file: {path}", 'INFO')
+        else:
+            self.debug_log.disable_file()
     
     def toggle_debug(self):
         """Debug Frame ein/ausblenden"""
@@ -230,7 +1806,7 @@ class DruckManager:
     def on_drop(self, event):
         """Drag & Drop Handler"""
         files = self.root.tk.splitlist(event.data)
-        image_files = [f for f in files if f.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp'))]
+        image_files = [f for f in files if f.lower().endswith(IMAGE_EXTENSIONS + MULTIPAGE_EXTENSIONS)]
         self.log_debug(f"Files received via drag & drop: {len(image_files)}")
         self.process_images(image_files)
     
@@ -238,7 +1814,8 @@ class DruckManager:
         """Select images manually"""
         files = filedialog.askopenfilenames(
             title="Select images",
-            filetypes=[("Image files", "*.png *.jpg *.jpeg *.gif *.bmp"), ("All files", "*.*")]
+            filetypes=[("Image files", "*.png *.jpg *.jpeg *.gif *.bmp *.tif *.tiff"),
+                       ("PDF documents", "*.pdf"), ("All files", "*.*")]
         )
         if files:
             self.log_debug(f"Files selected: {len(files)}")
@@ -249,21 +1826,65 @@ class DruckManager:
         if not image_files:
             return
         
-        # Wenn ungerade Anzahl, letztes Bild als einzelnes Paar (Rueckseite leer)
-        for i in range(0, len(image_files), 2):
-            front = image_files[i]
-            back = image_files[i + 1] if i + 1 < len(image_files) else None
+        # Mehrseitige TIFF/PDF in einzelne Seitenreferenzen aufteilen (ohne zu dekodieren)
+        image_files = list(iter_input_pages(image_files))
+        
+        # Vorabpruefung: defekte Dateien gar nicht erst aufnehmen (Export scheitert nie spaet)
+        flagged = self.preflight(image_files)
+        image_files = [ref for ref in image_files if not self.image_info[ref]['corrupt']]
+        
+        strategy = PAIRING_STRATEGIES.get(self.pairing_mode.get(), 'sequential')
+        self.log_debug(f"Pairing strategy: {strategy}")
+        for front, back in self.pairing_engine.pair(image_files, strategy):
             self.images.append((front, back))
             self.log_debug(f"Pair added: front={front}, back={back}")
         
         self.update_previews()
         self.update_tile_view()
         self.log_debug(f"Total pairs: {len(self.images)}")
+        if flagged:
+            self.show_preflight_report(flagged)
+    
+    def preflight(self, image_refs):
+        """Check all new pages in parallel and cache their metadata; returns the flagged ones"""
+        pending = [ref for ref in dict.fromkeys(image_refs) if ref not in self.image_info]
+        if pending:
+            with ThreadPoolExecutor(max_workers=self.export_workers) as pool:
+                for info in pool.map(preflight_image, pending):
+                    self.image_info[info['path']] = info
+        flagged = [self.image_info[ref] for ref in dict.fromkeys(image_refs) if self.image_info[ref]['problems']]
+        for info in flagged:
+            level = 'ERROR' if info['corrupt'] else 'WARNING'
+            self.log_debug(f"Preflight {info['path']}: {'; '.join(info['problems'])}", level)
+        return flagged
+    
+    def show_preflight_report(self, flagged):
+        """Alle Befunde einer Vorabpruefung in einem nicht-modalen Fenster anzeigen"""
+        if self.headless:
+            return
+        lines = []
+        for info in flagged:
+            prefix = "[skipped] " if info['corrupt'] else ""
+            lines.append(f"{prefix}{os.path.basename(info['path'])}: {'; '.join(info['problems'])}")
+        skipped = sum(1 for info in flagged if info['corrupt'])
+        summary = f"{len(flagged)} file(s) with problems, {skipped} skipped as unreadable\n\n"
+        
+        if self.preflight_window is None or not self.preflight_window.winfo_exists():
+            self.preflight_window = tk.Toplevel(self.root)
+            self.preflight_window.title("Import check")
+            self.preflight_window.geometry("700x300")
+            self.preflight_text = scrolledtext.ScrolledText(self.preflight_window, height=15, width=90)
+            self.preflight_text.pack(fill=tk.BOTH, expand=True)
+        self.preflight_text.delete("1.0", tk.END)
+        self.preflight_text.insert(tk.END, summary + "\n".join(lines))
+        self.preflight_window.lift()
     
     def clear_all(self):
         """Clear all images"""
         self.images = []
         self.image_mirrors = {}
+        self.image_info = {}
+        self.selected_pairs = set()
         self.current_pair_index = 0
         self.update_previews()
         self.update_tile_view()
@@ -272,8 +1893,8 @@ class DruckManager:
     def update_previews(self):
         """Update preview"""
         if not self.images:
-            self.front_preview.config(image='')
-            self.back_preview.config(image='')
+            self.front_preview.config(image='', text='')
+            self.back_preview.config(image='', text='')
             if self.pair_label:
                 self.pair_label.config(text="Pair 0 of 0")
             return
@@ -283,45 +1904,145 @@ class DruckManager:
             
             # Vorderseite
             if front_path:
-                self.show_preview(front_path, self.front_preview, 
-                                pair_index=self.current_pair_index, side='front')
+                self.show_cached_preview(front_path, self.front_preview,
+                                         pair_index=self.current_pair_index, side='front')
                 # Rechtsklick Menue
                 self.front_preview.bind("<Button-3>", lambda e: self.show_image_menu(e, self.current_pair_index, 'front'))
             else:
-                self.front_preview.config(image='')
+                self.front_preview.config(image='', text='')
                 self.front_preview.unbind("<Button-3>")
             
             # Rueckseite
             if back_path:
-                self.show_preview(back_path, self.back_preview,
-                                pair_index=self.current_pair_index, side='back')
+                self.show_cached_preview(back_path, self.back_preview,
+                                         pair_index=self.current_pair_index, side='back')
                 # Rechtsklick Menue
                 self.back_preview.bind("<Button-3>", lambda e: self.show_image_menu(e, self.current_pair_index, 'back'))
             else:
-                self.back_preview.config(image='')
+                self.back_preview.config(image='', text='')
                 self.back_preview.unbind("<Button-3>")
             
             if self.pair_label:
                 self.pair_label.config(text=f"Pair {self.current_pair_index + 1} of {len(self.images)}")
+            self.request_previews()
+    
+    def show_cached_preview(self, image_path, label_widget, pair_index=None, side=None):
+        """Beste vorhandene Vorschau sofort zeigen: scharf, sonst die kleine Version hochskaliert"""
+        entry = self.preview_images.get(image_path)
+        if entry is None:
+            label_widget.config(image='', text="Loading...")
+            label_widget.image = None
+            return
+        self.preview_images.move_to_end(image_path)
+        img = entry.get('full')
+        if img is None:
+            low = entry['low']
+            scale = min(PREVIEW_SIZE[0] / low.width, PREVIEW_SIZE[1] / low.height)
+            img = low.resize((max(1, round(low.width * scale)), max(1, round(low.height * scale))),
+                             Image.Resampling.BILINEAR)
+        mirror_type = 'none'
+        if pair_index is not None and side is not None:
+            mirror_type = self.image_mirrors.get((pair_index, side), 'none')
+        transpose = compose_transpose(self.image_orientation(image_path), mirror_type)
+        if transpose is not None:
+            img = img.transpose(transpose)
+        
+        from PIL import ImageTk
+        photo = ImageTk.PhotoImage(img)
+        label_widget.config(image=photo, text='')
+        label_widget.image = photo  # Referenz behalten
+    
+    def request_previews(self):
+        """Scharfe Vorschau fuer das aktuelle Paar und die Nachbarn im Hintergrund rendern"""
+        wanted = []
+        offsets = [0] + [d for k in range(1, PREVIEW_PREFETCH + 1) for d in (k, -k)]
+        for offset in offsets:
+            index = self.current_pair_index + offset
+            if 0 <= index < len(self.images):
+                for image_path in self.images[index]:
+                    if image_path and image_path not in wanted:
+                        wanted.append(image_path)
+        
+        # Wartende Auftraege verwerfen (uebersprungene Paare) und nach neuer Prioritaet einreihen;
+        # bereits laufende werden fertig gerendert und landen im Cache
+        for image_path, future in list(self.preview_futures.items()):
+            if future.cancel():
+                del self.preview_futures[image_path]
+        if self.preview_pool is None:
+            self.preview_pool = ThreadPoolExecutor(max_workers=2)
+        for image_path in wanted:
+            entry = self.preview_images.get(image_path)
+            if (entry is None or 'full' not in entry) and image_path not in self.preview_futures:
+                self.preview_futures[image_path] = self.preview_pool.submit(load_preview_images, image_path)
+        if self.preview_futures and self.preview_poll_job is None:
+            self.preview_poll_job = self.root.after(PREVIEW_POLL_MS, self.poll_previews)
+    
+    def poll_previews(self):
+        """Fertige Vorschauen uebernehmen (Haupt-Thread) und das aktuelle Paar verfeinern"""
+        self.preview_poll_job = None
+        current = ()
+        if 0 <= self.current_pair_index < len(self.images):
+            current = self.images[self.current_pair_index]
+        for image_path, future in list(self.preview_futures.items()):
+            if not future.done():
+                continue
+            del self.preview_futures[image_path]
+            try:
+                self.store_preview(image_path, future.result())
+            except Exception as e:
+                self.log_debug(f"Failed to load {image_path}: {e}", 'ERROR')
+                if image_path in current:
+                    label = self.front_preview if current[0] == image_path else self.back_preview
+                    label.config(image='', text="Could not load image")
+                    label.image = None
+                continue
+            for side, label in (('front', self.front_preview), ('back', self.back_preview)):
+                if current and current[side == 'back'] == image_path:
+                    self.show_cached_preview(image_path, label, self.current_pair_index, side)
+        if self.preview_futures:
+            self.preview_poll_job = self.root.after(PREVIEW_POLL_MS, self.poll_previews)
+    
+    def store_preview(self, image_path, entry):
+        """Vorschau cachen; aelteste Eintraege verlieren zuerst die scharfe, dann die kleine Version"""
+        self.preview_images[image_path] = entry
+        self.preview_images.move_to_end(image_path)
+        full_count = sum(1 for cached in self.preview_images.values() if 'full' in cached)
+        for cached in self.preview_images.values():
+            if full_count <= self.preview_full_cache_size:
+                break
+            if 'full' in cached:
+                del cached['full']
+                full_count -= 1
+        while len(self.preview_images) > self.preview_cache_size:
+            self.preview_images.popitem(last=False)
     
     def show_preview(self, image_path, label_widget, max_size=(400, 300), pair_index=None, side=None):
         """Show image in label"""
         try:
-            img = Image.open(image_path)
+            img = open_image(image_path, pdf_dpi=72)
+            
+            orientation = self.image_orientation(image_path, img)
+            
+            # Thumbnail erstellen mit Seitenverhaeltnis (vor dem Spiegeln, damit JPEG-Draft greift)
+            img.thumbnail(max_size, Image.Resampling.LANCZOS)
             
-            # Spiegelung anwenden wenn vorhanden
+            # Drehung und Spiegelung in einem Schritt anwenden
+            mirror = 'none'
             if pair_index is not None and side is not None:
                 mirror = self.image_mirrors.get((pair_index, side), 'none')
-                img = self.apply_mirror(img, mirror)
+            transpose = compose_transpose(orientation, mirror)
+            if transpose is not None:
+                img = img.transpose(transpose)
             
-            # Thumbnail erstellen mit Seitenverhaeltnis
-            img.thumbnail(max_size, Image.Resampling.LANCZOS)
+            from PIL import ImageTk
             photo = ImageTk.PhotoImage(img)
-            label_widget.config(image=photo)
+            label_widget.config(image=photo, text='')
             label_widget.image = photo  # Referenz behalten
         except Exception as e:
-            self.log_debug(f"Failed to load {image_path}: {e}")
-            messagebox.showerror("Error", f"Could not load image: {e}")
+            # Kein modaler Dialog: defekte Dateien meldet bereits die Vorabpruefung
+            self.log_debug(f"Failed to load {image_path}: {e}", 'ERROR')
+            label_widget.config(image='', text="Could not load image")
+            label_widget.image = None
     
     def apply_mirror(self, img, mirror_type):
         """Spiegelung auf Bild anwenden"""
@@ -338,31 +2059,91 @@ class DruckManager:
         """Trim white/transparent borders"""
         try:
             if img.mode in ("RGBA", "LA"):
-                alpha = img.split()[-1]
-                bbox = alpha.getbbox()
+                bbox = self.strip_bbox(img, lambda strip: strip.getchannel(strip.mode[-1]))
                 if bbox:
                     return img.crop(bbox)
             # Fallback: weissen Hintergrund entfernen
-            rgb = img.convert("RGB")
-            bg = Image.new("RGB", rgb.size, (255, 255, 255))
-            diff = ImageChops.difference(rgb, bg)
-            bbox = diff.getbbox()
+            bbox = self.strip_bbox(img, lambda strip: ImageChops.difference(
+                strip.convert("RGB"), Image.new("RGB", strip.size, (255, 255, 255))))
             if bbox:
                 return img.crop(bbox)
         except Exception as e:
-            self.log_debug(f"Trim failed: {e}")
+            self.log_debug(f"Trim failed: {e}", 'WARNING')
         return img
 
-    def load_base_image(self, image_path, pair_index=None, side=None, mirror=False, trim=False):
-        """Bild laden, spiegeln und optional zuschneiden (ohne Skalierung)"""
-        img = Image.open(image_path)
+    def strip_bbox(self, img, content_mask):
+        """Bounding box of non-background content, computed strip by strip
+        (temporary buffers stay at strip size instead of full-size copies)"""
+        left, top, right, bottom = img.width, img.height, 0, 0
+        for y in range(0, img.height, STRIP_HEIGHT):
+            strip = img.crop((0, y, img.width, min(img.height, y + STRIP_HEIGHT)))
+            bbox = content_mask(strip).getbbox()
+            if bbox:
+                left = min(left, bbox[0])
+                top = min(top, y + bbox[1])
+                right = max(right, bbox[2])
+                bottom = max(bottom, y + bbox[3])
+        if right <= left or bottom <= top:
+            return None
+        return (left, top, right, bottom)
+
+    def reduce_large_image(self, img, min_side_px):
+        """Downsample oversized images right after opening, so mirroring and trimming
+        never work on the full-size original"""
+        if img.width * img.height <= LARGE_IMAGE_PIXELS:
+            return img
+        factor = min(img.width, img.height) // min_side_px
+        if factor < 2:
+            return img
+        original_size = img.size
+        if img.format == 'JPEG':
+            # DCT-Skalierung beim Dekodieren, das Vollbild wird nie geladen
+            img.draft(img.mode, (img.width // factor, img.height // factor))
+        else:
+            try:
+                reduced = img.reduce(factor)
+            except ValueError:
+                # Modus wird von reduce() nicht unterstuetzt (z.B. 'P', '1')
+                return img
+            img.close()
+            img = reduced
+        self.log_debug(f"Large image reduced: {original_size[0]}x{original_size[1]} -> "
+                       f"{img.width}x{img.height} px")
+        return img
+
+    def effective_mirror(self, pair_index=None, side=None, mirror=False):
+        """Tatsaechliche Spiegelung fuer ein Bild bestimmen"""
         if pair_index is not None and side is not None:
-            mirror_type = self.image_mirrors.get((pair_index, side), 'none')
-            img = self.apply_mirror(img, mirror_type)
-        elif mirror:
-            img = img.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
+            return self.image_mirrors.get((pair_index, side), 'none')
+        return 'h' if mirror else 'none'
+
+    def image_orientation(self, image_ref, img=None):
+        """EXIF orientation from the import check; header fallback for unchecked images"""
+        info = self.image_info.get(image_ref)
+        if info is not None:
+            return info['orientation']
+        return read_orientation(img) if img is not None else 1
+
+    def load_base_image(self, image_path, pair_index=None, side=None, mirror=False, trim=False,
+                        min_side_px=None, mirror_type=None):
+        """Bild laden, aufrichten, spiegeln und optional zuschneiden (ohne Skalierung)
+        
+        min_side_px: grosse Bilder duerfen bis auf diese kuerzere Seite verkleinert werden
+        mirror_type: bereits aufgeloeste Spiegelung (statt pair_index/side/mirror)
+        """
+        img = open_image(image_path)
+        orientation = self.image_orientation(image_path, img)
+        if min_side_px:
+            img = self.reduce_large_image(img, min_side_px)
+        if mirror_type is None:
+            mirror_type = self.effective_mirror(pair_index, side, mirror)
+        # Rand vor der Drehung abschneiden (Ergebnis ist gleich), dann EXIF-Drehung und
+        # Spiegelung als eine Operation auf dem verkleinerten, zugeschnittenen Bild
         if trim:
             img = self.trim_image(img)
+        transpose = compose_transpose(orientation, mirror_type)
+        if transpose is not None:
+            img = img.transpose(transpose)
         return img
 
     def compute_target_size_cm(self, img, available_width_cm, available_height_cm):
@@ -375,35 +2156,46 @@ class DruckManager:
             width_cm = height_cm / aspect_ratio
         return width_cm, height_cm
 
-    def prepare_export_image(self, img, target_width_cm=None, target_height_cm=None):
+    def prepare_export_image(self, img, target_width_cm=None, target_height_cm=None, dpi=None):
         """Scale image for export (PDF/Word) to target size"""
         if target_width_cm is None or target_height_cm is None:
             return img
-        target_dpi = 300
+        target_dpi = dpi or self.export_dpi
         target_width_px = int(target_width_cm / 2.54 * target_dpi)
         target_height_px = int(target_height_cm / 2.54 * target_dpi)
         return img.resize((target_width_px, target_height_px), Image.Resampling.LANCZOS)
     
     def update_tile_view(self):
         """Update tile view"""
+        self.update_sheet_count()
         # Alte Widgets loeschen
         for widget in self.tile_scrollable.winfo_children():
             widget.destroy()
+        self.tile_pending = {}
+        self.tile_render_queue = []
+        self.tile_frames = {}
+        self.tile_layout = None
+        self.drag_feedback = None
+        if self.tile_placeholder is None:
+            self.tile_placeholder = tk.PhotoImage(width=120, height=90)
         
         # Neue Kacheln erstellen
         for idx, (front_path, back_path) in enumerate(self.images):
             pair_frame = ttk.Frame(self.tile_scrollable, relief=tk.RAISED, borderwidth=2)
             pair_frame.pack(fill=tk.X, padx=5, pady=5)
             pair_frame.pair_index = idx  # Index speichern
+            self.tile_frames[idx] = pair_frame
             
             # Drag Handle (sichtbarer Bereich oben mit Hinweis)
-            drag_handle_frame = tk.Frame(pair_frame, height=20, bg="lightblue", cursor="hand2")
+            handle_bg = "gold" if idx in self.selected_pairs else "lightblue"
+            drag_handle_frame = tk.Frame(pair_frame, height=20, bg=handle_bg, cursor="hand2")
             drag_handle_frame.pack(fill=tk.X)
             drag_handle_frame.pair_index = idx
             drag_label = tk.Label(drag_handle_frame, text="☰ Drag to reorder", 
-                                 bg="lightblue", fg="darkblue", font=("Arial", 8))
+                                 bg=handle_bg, fg="darkblue", font=("Arial", 8))
             drag_label.pack()
             drag_label.pair_index = idx
+            pair_frame.drag_handle = (drag_handle_frame, drag_label)  # fuer Auswahl-Markierung
             
             # Hauptinhalt
             content_frame = ttk.Frame(pair_frame)
@@ -423,11 +2215,11 @@ class DruckManager:
             ttk.Label(front_frame, text="Front").pack()
             front_tile_frame = tk.Frame(front_frame, bg="white", relief=tk.SUNKEN, borderwidth=1)
             front_tile_frame.pack()
-            front_tile = tk.Label(front_tile_frame, bg="white")
+            front_tile = tk.Label(front_tile_frame, bg="white", image=self.tile_placeholder)
             front_tile.pack(padx=2, pady=2)
             if front_path:
-                self.show_preview(front_path, front_tile, max_size=(120, 120), 
-                                pair_index=idx, side='front')
+                # Thumbnail wird erst gerendert wenn die Kachel sichtbar wird
+                self.tile_pending[(idx, 'front')] = (front_tile, front_path, pair_frame)
                 front_tile.bind("<Button-3>", lambda e, i=idx: self.show_image_menu(e, i, 'front'))
             
             # Rueckseite Kachel
@@ -436,13 +2228,13 @@ class DruckManager:
             ttk.Label(back_frame, text="Back").pack()
             back_tile_frame = tk.Frame(back_frame, bg="white", relief=tk.SUNKEN, borderwidth=1)
             back_tile_frame.pack()
-            back_tile = tk.Label(back_tile_frame, bg="white")
+            back_tile = tk.Label(back_tile_frame, bg="white", image=self.tile_placeholder)
             back_tile.pack(padx=2, pady=2)
             if back_path:
-                self.show_preview(back_path, back_tile, max_size=(120, 120),
-                                pair_index=idx, side='back')
+                self.tile_pending[(idx, 'back')] = (back_tile, back_path, pair_frame)
                 back_tile.bind("<Button-3>", lambda e, i=idx: self.show_image_menu(e, i, 'back'))
             else:
+                back_tile.config(image='')
                 ttk.Label(back_tile_frame, text="(empty)", bg="white").pack(padx=2, pady=2)
             
             # Drag & Drop Events
@@ -453,7 +2245,7 @@ class DruckManager:
             def make_drag_end(i):
                 return lambda e: self.on_drag_end(e, i)
             def make_click_handler(i):
-                return lambda e: self.select_pair(i)
+                return lambda e: self.select_pair(i, e)
             
             # Drag Handle Events
             drag_handle_frame.bind("<Button-1>", make_drag_start(idx))
@@ -498,13 +2290,234 @@ class DruckManager:
                 back_tile_frame.bind("<Button-1>", lambda e, i=idx, s='back': self.on_image_drag_start(e, i, s))
                 back_tile_frame.bind("<B1-Motion>", lambda e, i=idx, s='back': self.on_image_drag_motion(e, i, s))
                 back_tile_frame.bind("<ButtonRelease-1>", lambda e, i=idx, s='back': self.on_image_drag_end(e, i, s))
+            
+        # Sichtbare Kacheln rendern
+        self.schedule_tile_render()
+    
+    def on_tiles_configure(self, event):
+        """Scrollbereich anpassen und Geometrie-Index verwerfen"""
+        self.tile_canvas.configure(scrollregion=self.tile_canvas.bbox("all"))
+        self.tile_layout = None
+    
+    def get_tile_layout(self):
+        """Sorted tile offsets within the tile frame (built once per layout change)"""
+        if self.tile_layout is None:
+            rows = []
+            for idx, frame in self.tile_frames.items():
+                try:
+                    top = frame.winfo_y()
+                    left = frame.winfo_x()
+                    rows.append((top, top + frame.winfo_height(), left, left + frame.winfo_width(), idx))
+                except tk.TclError:
+                    continue
+            rows.sort()
+            self.tile_layout = {
+                'tops': [row[0] for row in rows],
+                'bottoms': [row[1] for row in rows],
+                'lefts': [row[2] for row in rows],
+                'rights': [row[3] for row in rows],
+                'indices': [row[4] for row in rows],
+            }
+        return self.tile_layout
+    
+    def find_tile_row(self, y_root):
+        """Position in the tile layout for a screen Y coordinate (bisect, no per-widget Tk calls)"""
+        layout = self.get_tile_layout()
+        if not layout['tops']:
+            return layout, None
+        # Bildschirm- in Frame-Koordinaten umrechnen (beruecksichtigt Scrollposition)
+        y = y_root - self.tile_scrollable.winfo_rooty()
+        return layout, bisect.bisect_right(layout['tops'], y) - 1
+    
+    def on_tile_scroll(self, scrollbar, first, last):
+        """Scrollbar aktualisieren und sichtbare Kacheln nachladen"""
+        scrollbar.set(first, last)
+        self.schedule_tile_render()
+    
+    def schedule_tile_render(self):
+        """Kachel-Rendering planen (entprellt, veraltete Anfragen werden verworfen)"""
+        if self.tile_render_job is not None:
+            self.root.after_cancel(self.tile_render_job)
+        self.tile_render_job = self.root.after(30, self.refresh_tile_queue)
+    
+    def refresh_tile_queue(self):
+        """Render queue for visible tiles, nearest to the viewport center first"""
+        self.tile_render_job = None
+        if not self.tile_pending:
+            self.tile_render_queue = []
+            return
+        
+        view_height = self.tile_canvas.winfo_height()
+        top = self.tile_canvas.canvasy(0)
+        bottom = top + view_height
+        center = (top + bottom) / 2
+        # Eine Bildschirmhoehe ober- und unterhalb vorausladen
+        preload = max(view_height, 200)
+        
+        # Sichtbaren Bereich per bisect im Geometrie-Index suchen (keine Tk-Abfrage pro Kachel);
+        # die Paare liegen untereinander, daher sind auch die Unterkanten sortiert
+        layout = self.get_tile_layout()
+        first = bisect.bisect_left(layout['bottoms'], top - preload)
+        last = bisect.bisect_right(layout['tops'], bottom + preload)
+        queue = []
+        for row in range(first, last):
+            distance = abs((layout['tops'][row] + layout['bottoms'][row]) / 2 - center)
+            for side in ('front', 'back'):
+                key = (layout['indices'][row], side)
+                if key in self.tile_pending:
+                    queue.append((distance, key))
+        queue.sort()
+        self.tile_render_queue = [key for _, key in queue]
+        if self.tile_render_queue:
+            self.render_next_tiles()
     
-    def select_pair(self, index):
-        """Select pair in preview"""
+    def render_next_tiles(self):
+        """Naechste Kacheln aus der Warteschlange rendern"""
+        self.tile_render_job = None
+        rendered = 0
+        while self.tile_render_queue and rendered < self.tile_render_batch:
+            key = self.tile_render_queue.pop(0)
+            entry = self.tile_pending.pop(key, None)
+            if entry is None:
+                continue
+            label, image_path, _ = entry
+            pair_index, side = key
+            self.render_tile(label, image_path, pair_index, side)
+            rendered += 1
+        if self.tile_render_queue:
+            self.tile_render_job = self.root.after(1, self.render_next_tiles)
+    
+    def render_tile(self, label, image_path, pair_index, side):
+        """Thumbnail fuer eine Kachel anzeigen (aus Cache wenn vorhanden)"""
+        cache_key = (image_path, self.image_mirrors.get((pair_index, side), 'none'))
+        photo = self.thumbnail_cache.get(cache_key)
+        if photo is None:
+            self.show_preview(image_path, label, max_size=(120, 120),
+                              pair_index=pair_index, side=side)
+            photo = getattr(label, 'image', None)
+            if photo is None:
+                return
+            self.thumbnail_cache[cache_key] = photo
+            while len(self.thumbnail_cache) > self.thumbnail_cache_size:
+                self.thumbnail_cache.popitem(last=False)
+        else:
+            self.thumbnail_cache.move_to_end(cache_key)
+            label.config(image=photo, text='')
+            label.image = photo
+    
+    def select_pair(self, index, event=None):
+        """Select pair in preview (Ctrl+click: toggle, Shift+click: range for batch operations)"""
         if not self.dragging:  # Nur auswaehlen wenn nicht gedraggt wurde
+            state = event.state if event is not None else 0
+            if state & 0x0001 and self.selection_anchor is not None:  # Shift
+                low, high = sorted((self.selection_anchor, index))
+                self.selected_pairs = set(range(low, high + 1))
+            elif state & 0x0004:  # Ctrl
+                self.selected_pairs ^= {index}
+                self.selection_anchor = index
+            else:
+                self.selected_pairs = {index}
+                self.selection_anchor = index
+            self.update_selection_highlight()
             self.current_pair_index = index
             self.update_previews()
-        self.log_debug(f"Pair {index + 1} selected")
+        self.log_debug(f"Pair {index + 1} selected ({len(self.selected_pairs)} in selection)")
+    
+    def select_all_pairs(self):
+        """Alle Paare fuer Batch-Operationen auswaehlen"""
+        self.selected_pairs = set(range(len(self.images)))
+        self.update_selection_highlight()
+    
+    def update_selection_highlight(self):
+        """Auswahl an den Kachel-Griffen markieren (ohne die Kacheln neu aufzubauen)"""
+        for idx, pair_frame in self.tile_frames.items():
+            handle_bg = "gold" if idx in self.selected_pairs else "lightblue"
+            for widget in getattr(pair_frame, 'drag_handle', ()):
+                widget.config(bg=handle_bg)
+    
+    @contextlib.contextmanager
+    def batch(self):
+        """Transaktion fuer mehrere Aenderungen: Vorschau und Kacheln nur einmal am Ende aktualisieren"""
+        self.batch_depth += 1
+        try:
+            yield
+        finally:
+            self.batch_depth -= 1
+            if self.batch_depth == 0 and self.refresh_pending:
+                self.refresh_views(previews=False, tiles=False)
+    
+    def refresh_views(self, previews=True, tiles=True):
+        """Vorschau und/oder Kacheln aktualisieren (innerhalb von batch() erst am Ende, einmal)"""
+        if previews:
+            self.refresh_pending.add('previews')
+        if tiles:
+            self.refresh_pending.add('tiles')
+        if self.batch_depth:
+            return
+        pending, self.refresh_pending = self.refresh_pending, set()
+        if 'previews' in pending:
+            self.update_previews()
+        if 'tiles' in pending:
+            self.update_tile_view()
+    
+    def apply_pair_order(self, order):
+        """Paare in einem Schritt neu anordnen oder loeschen (order: alte Indizes in neuer Reihenfolge)
+        
+        Spiegelungen, Auswahl und aktuelles Paar wandern mit; keine Aktualisierung der Ansicht.
+        """
+        new_index = {old: new for new, old in enumerate(order)}
+        self.images = [self.images[old] for old in order]
+        self.image_mirrors = {(new_index[idx], side): mirror_type
+                              for (idx, side), mirror_type in self.image_mirrors.items() if idx in new_index}
+        self.selected_pairs = {new_index[idx] for idx in self.selected_pairs if idx in new_index}
+        if self.selection_anchor is not None:
+            self.selection_anchor = new_index.get(self.selection_anchor)
+        if self.current_pair_index in new_index:
+            self.current_pair_index = new_index[self.current_pair_index]
+        else:
+            # Geloeschtes aktuelles Paar: an gleicher Position bleiben
+            kept_before = sum(1 for old in order if old < self.current_pair_index)
+            self.current_pair_index = max(0, min(kept_before, len(self.images) - 1))
+    
+    def mirror_images(self, targets, mirror_type):
+        """Batch: one mirroring for many images (targets: [(pair_index, 'front'/'back')])"""
+        with self.batch():
+            for key in targets:
+                if mirror_type == 'none':
+                    self.image_mirrors.pop(key, None)
+                else:
+                    self.image_mirrors[key] = mirror_type
+            self.log_debug(f"Mirroring '{mirror_type}' set for {len(targets)} images")
+            self.refresh_views()
+    
+    def swap_pairs(self, pair_indices):
+        """Batch: swap front and back in many pairs"""
+        with self.batch():
+            for pair_index in pair_indices:
+                self.swap_pair_images(pair_index)
+    
+    def delete_pairs(self, pair_indices):
+        """Batch: delete many pairs at once"""
+        with self.batch():
+            remove = set(pair_indices)
+            self.apply_pair_order([idx for idx in range(len(self.images)) if idx not in remove])
+            self.log_debug(f"{len(remove)} pairs deleted")
+            self.refresh_views()
+    
+    def move_pairs(self, pair_indices, to_index):
+        """Batch: move a block of pairs (in their current order) to position to_index"""
+        with self.batch():
+            self.apply_pair_order(self.block_move_order(pair_indices, to_index))
+            self.log_debug(f"{len(set(pair_indices))} pairs moved to position {to_index + 1}")
+            self.refresh_views()
+    
+    def block_move_order(self, pair_indices, to_index):
+        """Neue Reihenfolge, wenn der Block vor dem to_index-ten verbleibenden Paar eingefuegt wird"""
+        block = sorted(set(pair_indices))
+        moved = set(block)
+        rest = [idx for idx in range(len(self.images)) if idx not in moved]
+        to_index = max(0, min(to_index, len(rest)))
+        return rest[:to_index] + block + rest[to_index:]
     
     def on_drag_start(self, event, index):
         """Drag starten"""
@@ -557,87 +2570,44 @@ class DruckManager:
     
     def find_drop_position(self, y_root):
         """Finde Zielposition basierend auf Y-Koordinate"""
-        # Hole alle Pair Frames mit ihren Positionen
-        pair_frames = []
-        for widget in self.tile_scrollable.winfo_children():
-            if hasattr(widget, 'pair_index'):
-                try:
-                    # Hole die Y-Position des Widgets relativ zum Bildschirm
-                    widget_y = widget.winfo_rooty()
-                    widget_height = widget.winfo_height()
-                    pair_frames.append({
-                        'index': widget.pair_index,
-                        'y': widget_y,
-                        'height': widget_height,
-                        'center': widget_y + widget_height / 2,
-                        'top': widget_y,
-                        'bottom': widget_y + widget_height
-                    })
-                except:
-                    # Fallback: verwende Index als Position
-                    pair_frames.append({
-                        'index': widget.pair_index,
-                        'y': widget.pair_index * 200,  # Geschaetzte Hoehe
-                        'height': 200,
-                        'center': widget.pair_index * 200 + 100,
-                        'top': widget.pair_index * 200,
-                        'bottom': (widget.pair_index + 1) * 200
-                    })
-        
-        if not pair_frames:
+        layout, row = self.find_tile_row(y_root)
+        if row is None:
             return self.drag_start_index
         
-        # Sortiere nach Y-Position
-        pair_frames.sort(key=lambda x: x['y'])
-        
-        # Finde passende Position basierend auf Mausposition
-        for frame_info in pair_frames:
-            if frame_info['top'] <= y_root <= frame_info['bottom']:
-                # Wenn ueber der Mitte, davor einfügen, sonst danach
-                if y_root < frame_info['center']:
-                    # Finde Index vor diesem Frame
-                    current_pos = pair_frames.index(frame_info)
-                    if current_pos > 0:
-                        return pair_frames[current_pos - 1]['index']
-                    return frame_info['index']
-                else:
-                    return frame_info['index']
-        
         # Wenn ueber allen, zurueck zum ersten
-        if y_root < pair_frames[0]['top']:
-            return pair_frames[0]['index']
-        
-        # Wenn unter allen, zurueck zum letzten
-        return pair_frames[-1]['index']
+        if row < 0:
+            return layout['indices'][0]
+        
+        # Wenn ueber der Mitte, davor einfuegen, sonst danach
+        y = y_root - self.tile_scrollable.winfo_rooty()
+        center = (layout['tops'][row] + layout['bottoms'][row]) / 2
+        if y < center and row > 0:
+            return layout['indices'][row - 1]
+        return layout['indices'][row]
     
     def reorder_pairs(self, from_index, to_index):
         """Reorder pairs"""
         if from_index == to_index:
             return
         
-        # Paar verschieben
-        pair = self.images.pop(from_index)
-        self.images.insert(to_index, pair)
-        
-        # Aktueller Index anpassen
-        if self.current_pair_index == from_index:
-            self.current_pair_index = to_index
-        elif from_index < self.current_pair_index <= to_index:
-            self.current_pair_index -= 1
-        elif to_index <= self.current_pair_index < from_index:
-            self.current_pair_index += 1
+        # Paar verschieben (Spiegelungen und Auswahl wandern mit)
+        self.apply_pair_order(self.block_move_order([from_index], to_index))
     
     def update_drag_feedback(self, from_index, to_index):
         """Visuelles Feedback waehrend des Drags"""
-        # Aktualisiere die Kachelansicht mit visuellen Markierungen
-        for widget in self.tile_scrollable.winfo_children():
-            if hasattr(widget, 'pair_index'):
-                if widget.pair_index == from_index:
-                    widget.config(relief=tk.SUNKEN, borderwidth=3)
-                elif widget.pair_index == to_index:
-                    widget.config(relief=tk.RIDGE, borderwidth=3)
-                else:
-                    widget.config(relief=tk.RAISED, borderwidth=2)
+        if self.drag_feedback == (from_index, to_index):
+            return
+        # Nur die zuvor markierten und die neuen Kacheln anpassen
+        if self.drag_feedback:
+            for idx in self.drag_feedback:
+                frame = self.tile_frames.get(idx)
+                if frame:
+                    frame.config(relief=tk.RAISED, borderwidth=2)
+        if from_index in self.tile_frames:
+            self.tile_frames[from_index].config(relief=tk.SUNKEN, borderwidth=3)
+        if to_index in self.tile_frames and to_index != from_index:
+            self.tile_frames[to_index].config(relief=tk.RIDGE, borderwidth=3)
+        self.drag_feedback = (from_index, to_index)
     
     def prev_pair(self):
         """Previous pair"""
@@ -700,8 +2670,7 @@ class DruckManager:
         self.log_debug(f"Pair {pair_index + 1} {side_name}: mirroring set to '{mirror_name}'")
         
         # Aktualisiere Vorschau
-        self.update_previews()
-        self.update_tile_view()
+        self.refresh_views()
     
     def swap_pair_images(self, pair_index):
         """Swap front and back within a pair"""
@@ -723,9 +2692,7 @@ class DruckManager:
             self.log_debug(f"Pair {pair_index + 1}: front/back swapped")
             
             # Aktualisiere Anzeige
-            if self.current_pair_index == pair_index:
-                self.update_previews()
-            self.update_tile_view()
+            self.refresh_views(previews=self.current_pair_index == pair_index)
     
     def show_pair_menu(self, event, pair_index):
         """Show context menu for pair"""
@@ -734,6 +2701,25 @@ class DruckManager:
         menu.add_command(label=f"Delete pair {pair_index + 1}", 
                         command=lambda: self.delete_pair(pair_index))
         menu.add_separator()
+        
+        # Batch-Operationen fuer die Auswahl (Strg/Shift+Klick auf Kacheln)
+        selected = sorted(self.selected_pairs)
+        if len(selected) > 1 and pair_index in self.selected_pairs:
+            backs = [(idx, 'back') for idx in selected if self.images[idx][1]]
+            all_sides = [(idx, side) for idx in selected for side in ('front', 'back')]
+            menu.add_command(label=f"Selected pairs: {len(selected)}", state=tk.DISABLED)
+            menu.add_command(label="Mirror backs horizontally",
+                             command=lambda: self.mirror_images(backs, 'h'))
+            menu.add_command(label="Clear mirroring",
+                             command=lambda: self.mirror_images(all_sides, 'none'))
+            menu.add_command(label="Swap front/back", command=lambda: self.swap_pairs(selected))
+            menu.add_command(label="Move to start", command=lambda: self.move_pairs(selected, 0))
+            menu.add_command(label="Move to end",
+                             command=lambda: self.move_pairs(selected, len(self.images)))
+            menu.add_command(label="Delete selected pairs", command=lambda: self.delete_pairs(selected))
+            menu.add_separator()
+        menu.add_command(label="Select all pairs", command=self.select_all_pairs)
+        menu.add_separator()
         menu.add_command(label="Cancel")
         
         try:
@@ -744,34 +2730,11 @@ class DruckManager:
     def delete_pair(self, pair_index):
         """Delete pair"""
         if 0 <= pair_index < len(self.images):
-            # Loesche Spiegelungseinstellungen
-            for key in list(self.image_mirrors.keys()):
-                if key[0] == pair_index:
-                    del self.image_mirrors[key]
-            
-            # Loesche Paar
-            self.images.pop(pair_index)
-            
-            # Aktualisiere Indizes in image_mirrors
-            new_mirrors = {}
-            for (idx, side), mirror_type in self.image_mirrors.items():
-                if idx > pair_index:
-                    new_mirrors[(idx - 1, side)] = mirror_type
-                elif idx < pair_index:
-                    new_mirrors[(idx, side)] = mirror_type
-            self.image_mirrors = new_mirrors
-            
-            # Aktualisiere current_pair_index
-            if self.current_pair_index >= len(self.images):
-                self.current_pair_index = max(0, len(self.images) - 1)
-            elif self.current_pair_index > pair_index:
-                self.current_pair_index -= 1
-            
+            self.apply_pair_order([idx for idx in range(len(self.images)) if idx != pair_index])
             self.log_debug(f"Pair {pair_index + 1} deleted")
             
             # Aktualisiere Anzeige
-            self.update_previews()
-            self.update_tile_view()
+            self.refresh_views()
     
     def on_image_drag_start(self, event, pair_index, side):
         """Start image drag"""
@@ -813,22 +2776,18 @@ class DruckManager:
     
     def find_image_at_position(self, x_root, y_root):
         """Find image at mouse position"""
-        for widget in self.tile_scrollable.winfo_children():
-            if hasattr(widget, 'pair_index'):
-                widget_y = widget.winfo_rooty()
-                widget_height = widget.winfo_height()
-                widget_x = widget.winfo_rootx()
-                widget_width = widget.winfo_width()
-                
-                if widget_x <= x_root <= widget_x + widget_width and widget_y <= y_root <= widget_y + widget_height:
-                    # Finde ob front oder back - linke Haelfte = front, rechte Haelfte = back
-                    pair_idx = widget.pair_index
-                    relative_x = x_root - widget_x
-                    if relative_x < widget_width / 2:
-                        return (pair_idx, 'front')
-                    else:
-                        return (pair_idx, 'back')
-        return (None, None)
+        layout, row = self.find_tile_row(y_root)
+        if row is None or row < 0:
+            return (None, None)
+        y = y_root - self.tile_scrollable.winfo_rooty()
+        x = x_root - self.tile_scrollable.winfo_rootx()
+        left, right = layout['lefts'][row], layout['rights'][row]
+        if y > layout['bottoms'][row] or not left <= x <= right:
+            return (None, None)
+        # Finde ob front oder back - linke Haelfte = front, rechte Haelfte = back
+        if x - left < (right - left) / 2:
+            return (layout['indices'][row], 'front')
+        return (layout['indices'][row], 'back')
     
     def swap_images_between_pairs(self, source_pair, source_side, target_pair, target_side):
         """Swap images between pairs"""
@@ -871,9 +2830,7 @@ class DruckManager:
         self.log_debug(f"Images swapped: pair {source_pair + 1} {source_side} <-> pair {target_pair + 1} {target_side}")
         
         # Aktualisiere Anzeige
-        if self.current_pair_index in [source_pair, target_pair]:
-            self.update_previews()
-        self.update_tile_view()
+        self.refresh_views(previews=self.current_pair_index in [source_pair, target_pair])
     
     
     def prepare_image_for_print(self, image_path, mirror=False, pair_index=None, side=None):
@@ -882,7 +2839,7 @@ class DruckManager:
             return None
         
         try:
-            img = Image.open(image_path)
+            img = open_image(image_path)
             
             # Individuelle Spiegelung verwenden wenn vorhanden
             if pair_index is not None and side is not None:
@@ -926,7 +2883,7 @@ class DruckManager:
             
             return img
         except Exception as e:
-            self.log_debug(f"Failed to prepare {image_path}: {e}")
+            self.log_debug(f"Failed to prepare {image_path}: {e}", 'ERROR')
             return None
     
     def print_images(self):
@@ -935,111 +2892,438 @@ class DruckManager:
             messagebox.showwarning("Warning", "No images to print.")
             return
         
+        spooler = self.get_print_spooler()
+        if self.direct_print.get() and spooler:
+            self.start_direct_print(spooler)
+            return
+        
         try:
             # Temporaeres PDF erstellen
-            import tempfile
             temp_pdf = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
             temp_pdf.close()
             
-            self.create_pdf(temp_pdf.name)
-            
-            # PDF oeffnen mit Druckdialog (Windows)
-            if sys.platform == 'win32':
-                # Oeffne PDF im Standard-Viewer, der dann den Druckdialog zeigt
-                os.startfile(temp_pdf.name)
-                self.log_debug("PDF opened - use print dialog")
-            else:
-                # Linux/Mac - versuche mit Druckdialog
-                try:
-                    # Versuche mit lpr (Linux) oder lp (Mac)
-                    if sys.platform == 'darwin':  # Mac
-                        os.system(f'open -a "Preview" "{temp_pdf.name}"')
-                    else:  # Linux
-                        os.system(f'xdg-open "{temp_pdf.name}"')
-                except:
-                    os.system(f'xdg-open {temp_pdf.name}')
+            # Ggf. zwei Dateien: Duplex und einseitig (Einzelbilder)
+            for pdf_path in self.create_pdf(temp_pdf.name):
+                # PDF oeffnen mit Druckdialog (Windows)
+                if sys.platform == 'win32':
+                    # Oeffne PDF im Standard-Viewer, der dann den Druckdialog zeigt
+                    os.startfile(pdf_path)
+                    self.log_debug("PDF opened - use print dialog")
+                else:
+                    # Linux/Mac - versuche mit Druckdialog
+                    try:
+                        # Versuche mit lpr (Linux) oder lp (Mac)
+                        if sys.platform == 'darwin':  # Mac
+                            os.system(f'open -a "Preview" "{pdf_path}"')
+                        else:  # Linux
+                            os.system(f'xdg-open "{pdf_path}"')
+                    except:
+                        os.system(f'xdg-open {pdf_path}')
             
         except Exception as e:
-            self.log_debug(f"Print failed: {e}")
+            self.log_debug(f"Print failed: {e}", 'ERROR')
             messagebox.showerror("Error", f"Print failed: {e}")
     
-    def create_pdf(self, filename):
-        """Create PDF"""
-        # PDF Seitenformat (Standard: Hochformat)
-        page_size = landscape(A4) if self.pdf_landscape.get() else A4
-        c = canvas.Canvas(filename, pagesize=page_size)
-        width, height = page_size
-        page_width_cm = 29.7 if self.pdf_landscape.get() else 21.0
-        page_height_cm = 21.0 if self.pdf_landscape.get() else 29.7
-        margin = self.margin.get() * cm
-        
-        self.log_debug(f"Creating PDF: {filename}")
+    def get_print_spooler(self):
+        """CUPS spooler, or a local fake spooler when DRUCKMGR_FAKE_SPOOL is set (testing)"""
+        fake_dir = os.environ.get('DRUCKMGR_FAKE_SPOOL')
+        if fake_dir:
+            return FakeSpooler(fake_dir)
+        if PrintSpooler.available():
+            return PrintSpooler(printer=os.environ.get('PRINTER'))
+        return None
+    
+    def start_direct_print(self, spooler):
+        """Render and spool the job in chunks of duplex sheets in a background thread"""
+        if self.print_thread and self.print_thread.is_alive():
+            messagebox.showwarning("Warning", "A print job is still being spooled.")
+            return
+        pages, simplex_pages = self.plan_runs()
+        sheets = count_sheets(pages, simplex_pages)
+        if not messagebox.askyesno("Print", f"Send {sheets} sheet(s) to {spooler.describe()} now?"):
+            return
+        settings = self.export_settings()
+        self.print_jobs = []
+        self.print_thread = threading.Thread(target=self.spool_print_job,
+                                             args=(spooler, pages, settings, simplex_pages), daemon=True)
+        self.print_thread.start()
+        self.poll_print_status()
+    
+    def spool_print_job(self, spooler, pages, settings, simplex_pages=()):
+        """Worker: render N sheets at a time and submit each chunk as soon as it is ready
+        
+        simplex_pages: Einzelbilder, die danach als einseitige Auftraege gedruckt werden
+        """
+        total_sheets = count_sheets(pages, simplex_pages)
+        runs = [(pages, 2)]  # gerade Seitenzahl je Auftrag: Duplex-Paritaet bleibt
+        if simplex_pages:
+            runs.append((simplex_pages, 1))
+        first_sheet = 1
+        try:
+            for run_pages, pages_per_sheet in runs:
+                pages_per_chunk = self.print_chunk_sheets * pages_per_sheet
+                for start in range(0, len(run_pages), pages_per_chunk):
+                    chunk = run_pages[start:start + pages_per_chunk]
+                    last_sheet = first_sheet + -(-len(chunk) // pages_per_sheet) - 1
+                    fd, temp_path = tempfile.mkstemp(suffix='.pdf')
+                    os.close(fd)
+                    try:
+                        self.render_pdf(temp_path, chunk, settings)
+                        job_id = spooler.submit(temp_path, f"Print Manager sheets {first_sheet}-{last_sheet}",
+                                                duplex=pages_per_sheet == 2)
+                    finally:
+                        os.remove(temp_path)
+                    self.print_jobs.append({'id': job_id, 'sheets': (first_sheet, last_sheet),
+                                            'status': 'spooled'})
+                    self.log_debug(f"Print job {job_id} spooled: sheets {first_sheet}-{last_sheet} "
+                                   f"of {total_sheets}{'' if pages_per_sheet == 2 else ' (one-sided)'}")
+                    first_sheet = last_sheet + 1
+        except Exception as e:
+            self.print_jobs.append({'id': None, 'sheets': None, 'status': f"failed: {e}"})
+            self.log_debug(f"Print failed: {e}", 'ERROR')
+            return
         
-        for idx, (front_path, back_path) in enumerate(self.images):
-            # Vorderseite
-            # Lade Originalbild fuer Groessenberechnung
-            if front_path:
-                base_img = self.load_base_image(front_path, pair_index=idx, side='front',
-                                               mirror=False, trim=self.auto_trim.get())
-                if self.scale_to_width.get():
-                    margin_cm = self.margin.get()
-                    available_width_cm = page_width_cm - (2 * margin_cm)
-                    available_height_cm = page_height_cm - (2 * margin_cm)
-                    img_width_cm, img_height_cm = self.compute_target_size_cm(
-                        base_img, available_width_cm, available_height_cm
-                    )
-                    export_img = self.prepare_export_image(base_img, img_width_cm, img_height_cm)
-                    img_width = img_width_cm * cm
-                    img_height = img_height_cm * cm
-                else:
-                    export_img = base_img
-                    dpi = 72
-                    img_width = (export_img.width / dpi) * 2.54 * cm
-                    img_height = (export_img.height / dpi) * 2.54 * cm
-                
-                # Zentrieren
-                x = (width - img_width) / 2
-                y = (height - img_height) / 2
-                
-                c.drawImage(ImageReader(export_img), x, y, width=img_width, height=img_height)
-                self.log_debug(f"Front {idx + 1} added: {img_width/cm:.2f} x {img_height/cm:.2f} cm")
+        # Auftragsstatus verfolgen bis alle Teilauftraege gedruckt sind
+        for _ in range(600):
+            for job in self.print_jobs:
+                if job['status'] not in PRINT_JOB_DONE:
+                    status = spooler.job_status(job['id'])
+                    if status != job['status']:
+                        job['status'] = status
+                        self.log_debug(f"Print job {job['id']}: {status}")
+            if all(job['status'] in PRINT_JOB_DONE for job in self.print_jobs):
+                break
+            time.sleep(2)
+    
+    def poll_print_status(self):
+        """Druckstatus im UI anzeigen (laeuft im Haupt-Thread)"""
+        jobs = list(self.print_jobs)
+        failed = [job for job in jobs if job['status'].startswith('failed')]
+        if failed:
+            text = f"Print {failed[0]['status']}"
+        elif jobs:
+            done = sum(1 for job in jobs if job['status'] in PRINT_JOB_DONE)
+            text = f"Print: {jobs[-1]['sheets'][1]} sheets spooled, {done}/{len(jobs)} jobs done"
+        else:
+            text = "Print: rendering first sheets..."
+        self.print_status_label.config(text=text)
+        if self.print_thread and self.print_thread.is_alive():
+            self.root.after(500, self.poll_print_status)
+    
+    def export_settings(self):
+        """Snapshot of the export settings (safe to use from worker threads)"""
+        return {
+            'margin': self.margin.get(),
+            'scale_to_width': self.scale_to_width.get(),
+            'auto_trim': self.auto_trim.get(),
+            'landscape': self.pdf_landscape.get(),
+            'dpi': self.export_dpi,
+            'encoding': self.image_encoding.get(),
+            'jpeg_quality': self.jpeg_quality,
+            'color_manage': self.color_management.get(),
+            'reproducible': self.reproducible_pdf.get(),
+        }
+    
+    def build_page_plan(self, images=None, image_mirrors=None):
+        """Page sequence for duplex export: front and back per pair (None = blank page)
+        
+        images/image_mirrors: Paare und Spiegelungen eines Auftrags statt der aktuellen Liste
+        """
+        if images is None:
+            images = self.images
+            image_mirrors = self.image_mirrors
+        image_mirrors = image_mirrors or {}
+        pages = []
+        for idx, (front_path, back_path) in enumerate(images):
+            for side, image_path in (('front', front_path), ('back', back_path)):
+                if not image_path:
+                    pages.append(None)
+                    continue
+                pages.append({
+                    'path': image_path,
+                    'pair_index': idx,
+                    'side': side,
+                    'mirror': image_mirrors.get((idx, side), 'none'),
+                })
+        return pages
+    
+    def plan_runs(self, images=None, image_mirrors=None, single_sided=None):
+        """Duplex page plan plus simplex pages, depending on how single-sided pairs are placed
+        
+        blank: leere Rueckseite je Einzelbild (wie build_page_plan)
+        back_to_back: Einzelbilder gesammelt am Ende, zwei pro Blatt
+        simplex: Einzelbilder in einer eigenen, einseitig gedruckten Ausgabe
+        """
+        if images is None:
+            images = self.images
+            image_mirrors = self.image_mirrors
+        if single_sided is None:
+            single_sided = SINGLE_SIDED_MODES.get(self.single_sided_mode.get(), 'blank')
+        pages = self.build_page_plan(images, image_mirrors)
+        if single_sided == 'blank':
+            return pages, []
+        duplex, singles = [], []
+        for front, back in zip(pages[0::2], pages[1::2]):
+            if front and back:
+                duplex += [front, back]
+            elif front or back:
+                singles.append(front or back)
+        if single_sided == 'back_to_back':
+            if len(singles) % 2:
+                singles.append(None)  # Paritaet fuer nachfolgende Auftraege
+            return duplex + singles, []
+        return duplex, singles
+    
+    def output_runs(self, filename):
+        """[(dateiname, seiten)]: Duplex-Ausgabe und ggf. die einseitige Ausgabe daneben"""
+        pages, simplex_pages = self.plan_runs()
+        if not simplex_pages:
+            return [(filename, pages)]
+        if not pages:
+            return [(filename, simplex_pages)]
+        stem, ext = os.path.splitext(filename)
+        return [(filename, pages), (stem + SIMPLEX_SUFFIX + ext, simplex_pages)]
+    
+    def update_sheet_count(self):
+        """Blattzahl des aktuellen Auftrags vor dem Export anzeigen (mit Ersparnis ggu. leeren Rueckseiten)"""
+        if self.sheet_count_label is None:
+            return
+        if not self.images:
+            self.sheet_count_label.config(text="")
+            return
+        pages, simplex_pages = self.plan_runs()
+        sheets = count_sheets(pages, simplex_pages)
+        text = f"Sheets: {sheets}"
+        if simplex_pages:
+            text += f" ({count_sheets(pages)} duplex + {len(simplex_pages)} simplex)"
+        saved = len(self.images) - sheets
+        if saved > 0:
+            text += f", {saved} saved"
+        self.sheet_count_label.config(text=text)
+    
+    def page_pixels(self, page_width_cm, page_height_cm, settings=None):
+        """Longest page side in export pixels (None when images keep their native size)"""
+        settings = settings or self.export_settings()
+        if not settings['scale_to_width']:
+            return None
+        return int(max(page_width_cm, page_height_cm) / 2.54 * settings['dpi'])
+    
+    def pdf_page_key(self, page, settings, page_width_cm, page_height_cm):
+        """Export cache key: source hash plus all transform parameters"""
+        return (self.export_cache.source_hash(page['path']), page['mirror'], settings['auto_trim'],
+                settings['scale_to_width'], settings['margin'], page_width_cm, page_height_cm,
+                settings['dpi'], settings['encoding'], settings['jpeg_quality'], settings['color_manage'])
+    
+    def pdf_page_key_for(self, page, settings):
+        """Export cache key for the PDF page size given by the settings"""
+        if settings['landscape']:
+            return self.pdf_page_key(page, settings, 29.7, 21.0)
+        return self.pdf_page_key(page, settings, 21.0, 29.7)
+    
+    def use_sharding(self, pages, settings):
+        """Sharding only for large jobs whose pages are mostly not in the export cache yet
+        
+        Shards rendern in eigenen Prozessen; bereits vorbereitete Seiten sind lokal schneller.
+        Reproduzierbare PDFs werden nie aufgeteilt: die Bytes duerfen nicht von Prozesszahl
+        oder Speicherdruck abhaengen.
+        """
+        if settings.get('reproducible'):
+            return False
+        if self.shard_processes <= 1 or len(pages) < SHARD_MIN_PAGES:
+            return False
+        uncached = sum(1 for page in pages
+                       if page and not self.export_cache.contains(self.pdf_page_key_for(page, settings)))
+        return uncached >= SHARD_MIN_PAGES
+    
+    def load_export_base(self, page, settings):
+        """Decode, mirror and trim one page once for all export writers"""
+        img = self.load_base_image(page['path'], mirror_type=page['mirror'],
+                                   trim=settings['auto_trim'],
+                                   min_side_px=self.page_pixels(29.7, 21.0, settings))
+        # Hier im Vorbereitungs-Pool dekodieren: die Writer teilen sich das Bild gleichzeitig,
+        # ein lazy geoeffnetes Bild wuerde sonst parallel aus derselben Datei geladen
+        img.load()
+        return img
+    
+    def prepare_pdf_page(self, page, settings, page_width_cm, page_height_cm, base_img=None):
+        """Prepare one PDF page (cached by source hash and transform parameters)"""
+        key = self.pdf_page_key(page, settings, page_width_cm, page_height_cm)
+        prepared = self.export_cache.get(key)
+        if prepared is not None:
+            return prepared
+        
+        if base_img is None:
+            base_img = self.load_export_base(page, settings)
+        if settings['scale_to_width']:
+            margin_cm = settings['margin']
+            available_width_cm = page_width_cm - (2 * margin_cm)
+            available_height_cm = page_height_cm - (2 * margin_cm)
+            img_width_cm, img_height_cm = self.compute_target_size_cm(
+                base_img, available_width_cm, available_height_cm
+            )
+            target_pixels = (img_width_cm / 2.54 * settings['dpi']) * (img_height_cm / 2.54 * settings['dpi'])
+            # Farbumrechnung auf der kleineren Fassung: vor dem Hochskalieren, nach dem Verkleinern
+            convert_first = base_img.width * base_img.height < target_pixels
+            if convert_first:
+                base_img = self.color_convert(base_img, settings)
+            export_img = self.prepare_export_image(base_img, img_width_cm, img_height_cm,
+                                                   dpi=settings['dpi'])
+            if not convert_first:
+                export_img = self.color_convert(export_img, settings)
+        else:
+            export_img = self.color_convert(base_img, settings)
+            dpi = 72
+            img_width_cm = (export_img.width / dpi) * 2.54
+            img_height_cm = (export_img.height / dpi) * 2.54
+        
+        content = None
+        if settings['encoding'] == 'auto':
+            content = classify_image_content(export_img)
+            self.log_debug(f"Image content: {content} ({page['path']})")
+        xobject = encode_pdf_image(export_img, hashlib.md5(repr(key).encode('utf-8')).hexdigest(),
+                                   content=content, jpeg_quality=settings['jpeg_quality'])
+        prepared = {'xobject': xobject, 'width_cm': img_width_cm, 'height_cm': img_height_cm}
+        self.export_cache.put(key, prepared, len(xobject.streamContent))
+        return prepared
+    
+    def color_convert(self, img, settings):
+        """Farbmanagement auf das (bereits verkleinerte) Exportbild anwenden, falls aktiviert"""
+        if not settings.get('color_manage'):
+            return img
+        return self.color_manager.to_srgb(img)
+    
+    def create_pdf(self, filename):
+        """Create PDF (plus <name>_simplex.pdf for single-sided pages, if chosen); returns the files"""
+        settings = self.export_settings()
+        files = []
+        for path, pages in self.output_runs(filename):
+            if self.use_sharding(pages, settings):
+                self.render_pdf_sharded(path, pages, settings)
+            else:
+                self.render_pdf(path, pages, settings)
+            files.append(path)
+        return files
+    
+    def render_pdf(self, filename, pages, settings):
+        """Write page plan to PDF (no Tk access, usable from worker threads)"""
+        self.run_export(pages, settings, [PdfExportWriter(self, filename, settings)])
+    
+    def render_pdf_sharded(self, filename, pages, settings, queue_dir=None):
+        """Render page ranges to partial PDFs in worker processes and merge them
+        
+        Die Shards liegen als Auftragsdateien in queue_dir (Standard: $DRUCKMGR_SHARD_DIR oder
+        ein privates temporaeres Verzeichnis, 0700); nur in einem ausdruecklich gesetzten
+        Verzeichnis koennen Worker auf anderen Rechnern mit "--shard-worker DIR" mitarbeiten.
+        Die lokalen Prozesse rendern nur die Shards dieses Auftrags. Jeder Shard hat eine gerade Seitenzahl, damit
+        Vorder- und Rueckseiten im zusammengefuegten PDF auf den richtigen Seiten bleiben.
+        """
+        import json
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        
+        queue_dir = queue_dir or os.environ.get('DRUCKMGR_SHARD_DIR')
+        # Ohne gemeinsames Verzeichnis nicht im allgemeinen Temp-Verzeichnis arbeiten: dort
+        # koennte jeder lokale Benutzer Shard-Auftraege ablegen
+        private_dir = None if queue_dir else tempfile.mkdtemp(prefix='druckmgr-shards-')
+        job_dir = tempfile.mkdtemp(prefix='job-', dir=queue_dir or private_dir)
+        processes = max(1, self.shard_processes)
+        # Mehrere Shards pro Prozess, damit langsame Bereiche sich ausgleichen
+        shard_pages = max(2, -(-len(pages) // (processes * 4)))
+        shard_pages += shard_pages % 2
+        shards = []
+        try:
+            for start in range(0, len(pages), shard_pages):
+                base = os.path.join(job_dir, f"shard-{start // shard_pages:05d}")
+                with open(base + '.json.tmp', 'w', encoding='utf-8') as f:
+                    json.dump({'pages': pages[start:start + shard_pages], 'settings': settings}, f)
+                os.replace(base + '.json.tmp', base + '.json')
+                shards.append(base)
+            self.log_debug(f"Sharded export: {len(pages)} pages in {len(shards)} shards, "
+                           f"{processes} processes")
             
-            c.showPage()
+            # Lokale Prozesse arbeiten die Warteschlange ab (spawn: kein Fork des Tk-Prozesses)
+            with ProcessPoolExecutor(max_workers=processes,
+                                     mp_context=multiprocessing.get_context('spawn')) as pool:
+                local = [pool.submit(run_shard_worker, os.path.dirname(job_dir), True,
+                                     os.path.basename(job_dir))
+                         for _ in range(processes)]
+                for future in local:
+                    future.result()
             
-            # Rueckseite
-            if back_path:
-                use_global_mirror = self.mirror_back.get() if (idx, 'back') not in self.image_mirrors else False
-                base_back_img = self.load_base_image(back_path, pair_index=idx, side='back',
-                                                    mirror=use_global_mirror, trim=self.auto_trim.get())
-                if self.scale_to_width.get():
-                    margin_cm = self.margin.get()
-                    available_width_cm = page_width_cm - (2 * margin_cm)
-                    available_height_cm = page_height_cm - (2 * margin_cm)
-                    img_width_cm, img_height_cm = self.compute_target_size_cm(
-                        base_back_img, available_width_cm, available_height_cm
-                    )
-                    export_back_img = self.prepare_export_image(base_back_img, img_width_cm, img_height_cm)
-                    img_width = img_width_cm * cm
-                    img_height = img_height_cm * cm
-                else:
-                    export_back_img = base_back_img
-                    dpi = 72
-                    img_width = (export_back_img.width / dpi) * 2.54 * cm
-                    img_height = (export_back_img.height / dpi) * 2.54 * cm
-                
-                # Zentrieren
-                x = (width - img_width) / 2
-                y = (height - img_height) / 2
-                
-                c.drawImage(ImageReader(export_back_img), x, y, width=img_width, height=img_height)
-                self.log_debug(f"Back {idx + 1} added: {img_width/cm:.2f} x {img_height/cm:.2f} cm")
-            else:
-                self.log_debug(f"Back {idx + 1} is empty")
+            # Auf Shards warten, die andere Rechner beansprucht haben
+            last_progress = time.time()
+            finished = 0
+            while True:
+                errors = [base for base in shards if os.path.exists(base + '.error')]
+                if errors:
+                    with open(errors[0] + '.error', encoding='utf-8') as f:
+                        raise RuntimeError(f"Shard {os.path.basename(errors[0])} failed: {f.read()}")
+                done = sum(1 for base in shards if os.path.exists(base + '.pdf'))
+                if done == len(shards):
+                    break
+                if done > finished:
+                    finished, last_progress = done, time.time()
+                elif time.time() - last_progress > SHARD_TIMEOUT:
+                    raise RuntimeError(f"Sharded export stalled: {done}/{len(shards)} shards finished")
+                time.sleep(SHARD_POLL_INTERVAL)
             
-            c.showPage()
-        
-        c.save()
-        self.log_debug(f"PDF saved: {filename}")
+            page_count = merge_pdf_parts([base + '.pdf' for base in shards], filename)
+            # Seiten der Shards in den eigenen Export-Cache uebernehmen (schneller Re-Export)
+            for base in shards:
+                with contextlib.suppress(OSError, ValueError, KeyError):
+                    for key, (prepared, size) in read_shard_cache(base + '.cache').items():
+                        self.export_cache.put(key, prepared, size)
+            self.log_debug(f"PDF saved: {filename} ({page_count} pages from {len(shards)} shards)")
+        finally:
+            shutil.rmtree(private_dir or job_dir, ignore_errors=True)
+    
+    def run_export(self, pages, settings, writers):
+        """Prepare each page once (in parallel, in page order) and fan it out to all writers"""
+        self.export_cache.reset_stats()
+        workers = max(1, min(self.export_workers, len(pages)))
+        with ThreadPoolExecutor(max_workers=workers) as prepare_pool, \
+                ThreadPoolExecutor(max_workers=len(writers)) as write_pool:
+            pending = deque()
+            submitted = 0
+            
+            def fill():
+                # Vorbereitete Seiten im Speicher begrenzen; der Governor kann das Fenster
+                # waehrend des Exports verkleinern
+                nonlocal submitted
+                window = max(1, min(workers, self.export_workers) * self.export_window_factor)
+                while submitted < len(pages) and len(pending) < window:
+                    page = pages[submitted]
+                    if page and any(writer.needs_image(page) for writer in writers):
+                        pending.append(prepare_pool.submit(self.load_export_base, page, settings))
+                    else:
+                        pending.append(None)
+                    submitted += 1
+            
+            try:
+                fill()
+                for page_number, page in enumerate(pages):
+                    future = pending.popleft()
+                    base_img = future.result() if future else None
+                    fill()
+                    # Alle Writer erhalten dieselbe vorbereitete Seite gleichzeitig
+                    results = [write_pool.submit(writer.add_page, page_number, page, base_img)
+                               for writer in writers]
+                    wait(results)  # bei einem Fehler erst alle Writer dieser Seite fertig werden lassen
+                    for result in results:
+                        result.result()
+            except BaseException:
+                # Keine halb geschriebenen Dateien zuruecklassen
+                for future in pending:
+                    if future:
+                        future.cancel()
+                for writer in writers:
+                    try:
+                        writer.abort()
+                    except Exception as e:
+                        self.log_debug(f"Export cleanup failed: {e}", 'WARNING')
+                raise
+        for writer in writers:
+            writer.close()
     
     def open_file(self, filepath):
         """Open file with default app (cross-platform)"""
@@ -1057,7 +3341,7 @@ class DruckManager:
             self.log_debug(f"File opened: {filepath}")
             return True
         except Exception as e:
-            self.log_debug(f"Failed to open file: {e}")
+            self.log_debug(f"Failed to open file: {e}", 'ERROR')
             return False
     
     def export_pdf(self):
@@ -1073,13 +3357,14 @@ class DruckManager:
         
         if filename:
             try:
-                self.create_pdf(filename)
+                files = self.create_pdf(filename)
                 
                 # Automatisch oeffnen wenn aktiviert
                 if self.auto_open_export.get():
-                    self.open_file(filename)
+                    for path in files:
+                        self.open_file(path)
             except Exception as e:
-                self.log_debug(f"PDF export failed: {e}")
+                self.log_debug(f"PDF export failed: {e}", 'ERROR')
                 messagebox.showerror("Error", f"Save failed: {e}")
     
     def export_word(self):
@@ -1095,110 +3380,396 @@ class DruckManager:
         
         if filename:
             try:
-                doc = Document()
-                section = doc.sections[0]
-                # A4 im Querformat, damit 29.7 cm die Seitenbreite ist
-                section.orientation = WD_ORIENT.LANDSCAPE
-                section.page_width = Cm(29.7)
-                section.page_height = Cm(21.0)
-                # Margen explizit setzen, damit die Breite korrekt skaliert wird
-                section.left_margin = Cm(self.margin.get())
-                section.right_margin = Cm(self.margin.get())
-                section.top_margin = Cm(self.margin.get())
-                section.bottom_margin = Cm(self.margin.get())
-                available_width_cm = (section.page_width - section.left_margin - section.right_margin) / Cm(1)
-                available_height_cm = (section.page_height - section.top_margin - section.bottom_margin) / Cm(1)
-                
-                self.log_debug(f"Creating Word document: {filename}")
-                
-                for idx, (front_path, back_path) in enumerate(self.images):
-                    # Vorderseite auf eigener Seite
-                    if front_path:
-                        base_front_img = self.load_base_image(front_path, pair_index=idx, side='front',
-                                                             mirror=False, trim=self.auto_trim.get())
-                        front_img = base_front_img
-                        if front_img:
-                            # Bild in Bytes speichern
-                            img_bytes = io.BytesIO()
-                            front_img.save(img_bytes, format='PNG')
-                            img_bytes.seek(0)
-                            
-                            paragraph = doc.add_paragraph()
-                            paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                            run = paragraph.add_run()
-                            
-                            # Berechne korrekte Groesse wie im PDF
-                            if self.scale_to_width.get():
-                                img_width_cm, img_height_cm = self.compute_target_size_cm(
-                                    front_img, available_width_cm, available_height_cm
-                                )
-                                # Setze Breite und Hoehe
-                                run.add_picture(img_bytes, width=Cm(img_width_cm), height=Cm(img_height_cm))
-                                self.log_debug(f"Front {idx + 1} added: {img_width_cm:.2f} x {img_height_cm:.2f} cm")
-                            else:
-                                # Originalgroesse verwenden (auf Seitenbreite)
-                                run.add_picture(img_bytes, width=Cm(available_width_cm))
-                                self.log_debug(f"Front {idx + 1} added (page width)")
-                    
-                    # Seitenumbruch fuer Rueckseite (beidseitiger Druck)
-                    doc.add_page_break()
-                    
-                    # Rueckseite auf eigener Seite
-                    if back_path:
-                        # Verwende individuelle Spiegelung oder globale Einstellung
-                        use_global_mirror = self.mirror_back.get() if (idx, 'back') not in self.image_mirrors else False
-                        base_back_img = self.load_base_image(back_path, pair_index=idx, side='back',
-                                                            mirror=use_global_mirror, trim=self.auto_trim.get())
-                        back_img = base_back_img
-                        if back_img:
-                            img_bytes = io.BytesIO()
-                            back_img.save(img_bytes, format='PNG')
-                            img_bytes.seek(0)
-                            
-                            paragraph = doc.add_paragraph()
-                            paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                            run = paragraph.add_run()
-                            
-                            # Berechne korrekte Groesse wie im PDF
-                            if self.scale_to_width.get():
-                                img_width_cm, img_height_cm = self.compute_target_size_cm(
-                                    back_img, available_width_cm, available_height_cm
-                                )
-                                # Setze Breite und Hoehe
-                                run.add_picture(img_bytes, width=Cm(img_width_cm), height=Cm(img_height_cm))
-                                self.log_debug(f"Back {idx + 1} added: {img_width_cm:.2f} x {img_height_cm:.2f} cm")
-                            else:
-                                # Originalgroesse verwenden (auf Seitenbreite)
-                                run.add_picture(img_bytes, width=Cm(available_width_cm))
-                                self.log_debug(f"Back {idx + 1} added (page width)")
-                    else:
-                        # Leere Seite wenn keine Rueckseite
-                        paragraph = doc.add_paragraph()
-                        paragraph.add_run("(No back side)")
-                        self.log_debug(f"Back {idx + 1} is empty")
-                    
-                    # Seitenumbruch nur wenn nicht das letzte Paar
-                    if idx < len(self.images) - 1:
-                        doc.add_page_break()
+                settings = self.export_settings()
+                runs = self.output_runs(filename)
+                for path, pages in runs:
+                    self.run_export(pages, settings, [DocxExportWriter(self, path, settings, len(pages))])
                 
-                doc.save(filename)
-                self.log_debug(f"Word document saved: {filename}")
+                # Automatisch oeffnen wenn aktiviert
+                if self.auto_open_export.get():
+                    for path, pages in runs:
+                        self.open_file(path)
+            except Exception as e:
+                self.log_debug(f"Word export failed: {e}", 'ERROR')
+                messagebox.showerror("Error", f"Save failed: {e}")
+    
+    def export_multi(self):
+        """Save all selected formats from a single preparation pass"""
+        if not self.images:
+            messagebox.showwarning("Warning", "No images to export.")
+            return
+        selected = [fmt for fmt, var in self.export_formats.items() if var.get()]
+        if not selected:
+            messagebox.showwarning("Warning", "No export format selected.")
+            return
+        
+        filename = filedialog.asksaveasfilename(
+            title="Save as (base name for all formats)",
+            defaultextension=".pdf",
+            filetypes=[("PDF files", "*.pdf"), ("All files", "*.*")]
+        )
+        
+        if filename:
+            stem = os.path.splitext(filename)[0]
+            try:
+                settings = self.export_settings()
+                documents = []
+                # Duplex-Ausgabe und ggf. <name>_simplex.* ; Seitenbilder heissen immer nach Paar/Seite
+                for path, pages in self.output_runs(stem + '.pdf'):
+                    run_stem = os.path.splitext(path)[0]
+                    writers = []
+                    if 'pdf' in selected:
+                        documents.append(run_stem + '.pdf')
+                        writers.append(PdfExportWriter(self, documents[-1], settings))
+                    if 'docx' in selected:
+                        documents.append(run_stem + '.docx')
+                        writers.append(DocxExportWriter(self, documents[-1], settings, len(pages)))
+                    if 'png' in selected:
+                        writers.append(ImageExportWriter(self, stem, 'PNG', settings))
+                    if 'jpeg' in selected:
+                        writers.append(ImageExportWriter(self, stem, 'JPEG', settings))
+                    self.run_export(pages, settings, writers)
+                self.log_debug(f"Exported {', '.join(selected)}: {stem}")
                 
                 # Automatisch oeffnen wenn aktiviert
                 if self.auto_open_export.get():
-                    self.open_file(filename)
+                    for document in documents:
+                        self.open_file(document)
             except Exception as e:
-                self.log_debug(f"Word export failed: {e}")
+                self.log_debug(f"Export failed: {e}", 'ERROR')
                 messagebox.showerror("Error", f"Save failed: {e}")
 
 
+# Ausgabeformate des Dienstmodus: (Dateiendung, Content-Type)
+SERVICE_FORMATS = {
+    'pdf': ('.pdf', 'application/pdf'),
+    'docx': ('.docx', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'),
+}
+SERVICE_PORT = 8631
+
+
+class PrintPrepService:
+    """Headless print-prep service: job queue, worker pool, results streamed back over HTTP
+    
+    Alle Auftraege teilen sich eine DruckManager-Instanz (headless) und damit den Export-Cache.
+    Dateipfade in Auftraegen beziehen sich auf das Dateisystem des Dienst-Rechners.
+    """
+
+    def __init__(self, app, workers=2, result_dir=None, max_jobs=200):
+        import queue
+        
+        self.app = app
+        self.base_settings = app.export_settings()  # einmalig im Haupt-Thread lesen
+        self.result_dir = result_dir or tempfile.mkdtemp(prefix='druckmgr-service-')
+        self.max_jobs = max_jobs  # abgeschlossene Auftraege, die abrufbar bleiben
+        self.jobs = OrderedDict()  # {job_id: auftrag}
+        self.queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.next_id = 1
+        self.started = time.time()
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self.pages_done = 0
+        self.busy_seconds = 0.0
+        self.workers = [threading.Thread(target=self.worker, daemon=True) for _ in range(max(1, workers))]
+        for thread in self.workers:
+            thread.start()
+
+    def parse_job(self, spec):
+        """Auftragsbeschreibung (JSON) pruefen und in Seitenplan + Einstellungen umsetzen"""
+        if not isinstance(spec, dict):
+            raise ValueError("job spec must be a JSON object")
+        fmt = spec.get('format', 'pdf')
+        if fmt not in SERVICE_FORMATS:
+            raise ValueError(f"unsupported format: {fmt}")
+        if 'pairs' in spec:
+            # Paarreihenfolge vom Client vorgegeben
+            images = [(pair[0] or None, pair[1] if len(pair) > 1 else None) for pair in spec['pairs']]
+        elif 'files' in spec:
+            strategy = spec.get('pairing', 'sequential')
+            if strategy not in PAIRING_STRATEGIES.values():
+                raise ValueError(f"unknown pairing strategy: {strategy}")
+            images = self.app.pairing_engine.pair(list(iter_input_pages(spec['files'])), strategy)
+        else:
+            raise ValueError("job spec needs 'pairs' or 'files'")
+        # Paare wie [null, null] zaehlen nicht: ohne einen Bildpfad entstuende ein leeres Dokument
+        refs = {image_path for pair in images for image_path in pair if image_path}
+        if not refs:
+            raise ValueError("job has no images")
+        # Vorabpruefung: defekte Dateien weisen den Auftrag sofort ab statt mitten im Export
+        for info in map(preflight_image, sorted(refs)):
+            if info['corrupt']:
+                raise ValueError(f"{info['path']}: {'; '.join(info['problems'])}")
+        
+        # Spiegelungen: {"<paar>:<front|back>": "h"|"v"|"both"|"none"}
+        image_mirrors = {}
+        for key, mirror_type in spec.get('mirrors', {}).items():
+            pair_index, _, side = key.partition(':')
+            if side not in ('front', 'back') or mirror_type not in ('h', 'v', 'both', 'none'):
+                raise ValueError(f"invalid mirror entry: {key}={mirror_type}")
+            image_mirrors[(int(pair_index), side)] = mirror_type
+        
+        settings = dict(self.base_settings)
+        for key, cast in (('margin', float), ('scale_to_width', bool), ('auto_trim', bool),
+                          ('landscape', bool), ('dpi', int), ('jpeg_quality', int),
+                          ('color_manage', bool), ('reproducible', bool)):
+            if key in spec:
+                settings[key] = cast(spec[key])
+        if 'encoding' in spec:
+            if spec['encoding'] not in ('auto', 'lossless'):
+                raise ValueError(f"unknown encoding: {spec['encoding']}")
+            settings['encoding'] = spec['encoding']
+        # Einzelbilder: leere Rueckseite oder gesammelt am Ende (ein Ergebnis je Auftrag, kein Simplex)
+        single_sided = spec.get('single_sided', 'blank')
+        if single_sided not in ('blank', 'back_to_back'):
+            raise ValueError(f"unsupported single_sided mode: {single_sided}")
+        pages, _ = self.app.plan_runs(images, image_mirrors, single_sided)
+        return pages, settings, fmt
+
+    def submit(self, spec):
+        """Auftrag pruefen und einreihen (ValueError bei ungueltiger Beschreibung)"""
+        pages, settings, fmt = self.parse_job(spec)
+        with self.lock:
+            job_id = str(self.next_id)
+            self.next_id += 1
+            job = {'id': job_id, 'status': 'queued', 'format': fmt, 'pages': len(pages),
+                   'sheets': count_sheets(pages),
+                   'submitted': time.time(), 'started': None, 'finished': None,
+                   'result': None, 'error': None}
+            self.jobs[job_id] = job
+            self.prune_jobs()
+        self.queue.put((job, pages, settings))
+        self.app.log_debug(f"Job {job_id} queued: {len(pages)} pages as {fmt}", 'INFO')
+        return job
+
+    def prune_jobs(self):
+        """Aelteste abgeschlossene Auftraege verwerfen (Lock muss gehalten werden)"""
+        finished = [job for job in self.jobs.values() if job['status'] in ('done', 'failed', 'delivered')]
+        for job in finished[:max(0, len(finished) - self.max_jobs)]:
+            del self.jobs[job['id']]
+            if job['result'] and os.path.exists(job['result']):
+                os.remove(job['result'])
+
+    def worker(self):
+        """Worker-Thread: Auftraege nacheinander exportieren"""
+        while True:
+            job, pages, settings = self.queue.get()
+            self.run_job(job, pages, settings)
+            self.queue.task_done()
+
+    def run_job(self, job, pages, settings):
+        app = self.app
+        suffix = SERVICE_FORMATS[job['format']][0]
+        filename = os.path.join(self.result_dir, f"job-{job['id']}{suffix}")
+        with self.lock:
+            job['status'] = 'running'
+            job['started'] = time.time()
+            self.running += 1
+        try:
+            if job['format'] == 'pdf':
+                writer = PdfExportWriter(app, filename, settings)
+            else:
+                writer = DocxExportWriter(app, filename, settings, len(pages))
+            app.run_export(pages, settings, [writer])
+            status, error = 'done', None
+        except Exception as e:
+            status, error = 'failed', str(e)
+            app.log_debug(f"Job {job['id']} failed: {e}", 'ERROR')
+        with self.lock:
+            job['finished'] = time.time()
+            job['status'] = status
+            job['error'] = error
+            job['result'] = filename if status == 'done' else None
+            self.running -= 1
+            self.busy_seconds += job['finished'] - job['started']
+            if status == 'done':
+                self.completed += 1
+                self.pages_done += len(pages)
+            else:
+                self.failed += 1
+        app.log_debug(f"Job {job['id']} {status} in {job['finished'] - job['started']:.2f} s", 'INFO')
+        if app.debug_enabled:
+            for line in app.debug_log.take_pending():
+                print(line)
+
+    def job_info(self, job):
+        """Oeffentliche Sicht auf einen Auftrag (ohne Serverpfade)"""
+        info = {key: job[key] for key in ('id', 'status', 'format', 'pages', 'sheets', 'error')}
+        if job['started']:
+            info['wait_seconds'] = round(job['started'] - job['submitted'], 3)
+        if job['finished']:
+            info['run_seconds'] = round(job['finished'] - job['started'], 3)
+        return info
+
+    def metrics(self):
+        """Warteschlangentiefe und Durchsatz"""
+        with self.lock:
+            finished = self.completed + self.failed
+            return {
+                'queue_depth': self.queue.qsize(),
+                'running': self.running,
+                'workers': len(self.workers),
+                'completed': self.completed,
+                'failed': self.failed,
+                'pages': self.pages_done,
+                'pages_per_second': round(self.pages_done / self.busy_seconds, 2) if self.busy_seconds else 0.0,
+                'avg_job_seconds': round(self.busy_seconds / finished, 3) if finished else 0.0,
+                'uptime_seconds': round(time.time() - self.started, 1),
+                'cache_bytes': self.app.export_cache.current_bytes,
+            }
+
+    def take_result(self, job_id):
+        """Fertige Ergebnisdatei abholen (wird danach vom Dienst geloescht)"""
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if job is None or job['status'] != 'done' or not job['result']:
+                return job, None
+            result, job['result'] = job['result'], None
+            job['status'] = 'delivered'
+            return job, result
+
+    def make_handler(self):
+        """HTTP-Handler: POST /jobs, GET /jobs/<id>, GET /jobs/<id>/result, GET /metrics"""
+        import json
+        from http.server import BaseHTTPRequestHandler
+        
+        service = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            
+            def send_json(self, status, data):
+                body = json.dumps(data).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def do_POST(self):
+                if self.path.rstrip('/') != '/jobs':
+                    self.send_json(404, {'error': 'not found'})
+                    return
+                try:
+                    length = int(self.headers.get('Content-Length', 0))
+                    job = service.submit(json.loads(self.rfile.read(length) or b'null'))
+                except (ValueError, TypeError, KeyError, IndexError) as e:
+                    self.send_json(400, {'error': str(e)})
+                    return
+                self.send_json(202, service.job_info(job))
+            
+            def do_GET(self):
+                parts = [part for part in self.path.split('/') if part]
+                if parts == ['metrics']:
+                    self.send_json(200, service.metrics())
+                elif len(parts) == 2 and parts[0] == 'jobs':
+                    job = service.jobs.get(parts[1])
+                    if job is None:
+                        self.send_json(404, {'error': 'unknown job'})
+                    else:
+                        self.send_json(200, service.job_info(job))
+                elif len(parts) == 3 and parts[0] == 'jobs' and parts[2] == 'result':
+                    self.send_result(parts[1])
+                else:
+                    self.send_json(404, {'error': 'not found'})
+            
+            def send_result(self, job_id):
+                job, result = service.take_result(job_id)
+                if job is None:
+                    self.send_json(404, {'error': 'unknown job'})
+                    return
+                if result is None:
+                    self.send_json(409, service.job_info(job))
+                    return
+                try:
+                    self.send_response(200)
+                    self.send_header('Content-Type', SERVICE_FORMATS[job['format']][1])
+                    self.send_header('Content-Length', str(os.path.getsize(result)))
+                    self.send_header('Content-Disposition',
+                                     f'attachment; filename="job-{job_id}{SERVICE_FORMATS[job["format"]][0]}"')
+                    self.end_headers()
+                    # In Bloecken senden, die Datei wird nie komplett gelesen
+                    with open(result, 'rb') as f:
+                        shutil.copyfileobj(f, self.wfile, 1024 * 1024)
+                finally:
+                    os.remove(result)
+            
+            def log_message(self, format, *args):
+                # Kein address_string(): bei Unix-Sockets gibt es keine Client-Adresse
+                service.app.log_debug(f"HTTP {format % args}")
+        
+        return Handler
+
+    def serve(self, host='127.0.0.1', port=SERVICE_PORT, socket_path=None):
+        """HTTP auf host:port oder auf einem Unix-Socket bedienen (blockiert)"""
+        import socketserver
+        from http.server import ThreadingHTTPServer
+        
+        if socket_path:
+            class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+                daemon_threads = True
+            
+            if os.path.exists(socket_path):
+                os.remove(socket_path)
+            server = UnixHTTPServer(socket_path, self.make_handler())
+            address = socket_path
+        else:
+            server = ThreadingHTTPServer((host, port), self.make_handler())
+            address = f"http://{host}:{server.server_address[1]}"
+        print(f"Print Manager service listening on {address} ({len(self.workers)} workers)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            if socket_path and os.path.exists(socket_path):
+                os.remove(socket_path)
+
+
+def run_service(args):
+    """Dienstmodus ohne Fenster (kein Display noetig)"""
+    app = DruckManager(tk.Tcl(), headless=True)
+    app.debug_enabled = args.debug
+    app.resource_governor.start()
+    service = PrintPrepService(app, workers=args.workers)
+    service.serve(args.host, args.port, args.socket)
+
+
 def main():
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Print Manager - double-sided image printing")
+    parser.add_argument('--measure-startup', action='store_true',
+                        help="print the startup time and exit")
+    parser.add_argument('--serve', action='store_true',
+                        help="run as print-prep service (HTTP job queue, no window)")
+    parser.add_argument('--host', default='127.0.0.1', help="service address (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=SERVICE_PORT, help=f"service port (default: {SERVICE_PORT})")
+    parser.add_argument('--socket', help="serve on this Unix socket instead of TCP")
+    parser.add_argument('--workers', type=int, default=2, help="parallel service jobs (default: 2)")
+    parser.add_argument('--debug', action='store_true', help="print service debug output")
+    parser.add_argument('--shard-worker', metavar='DIR',
+                        help="render PDF shards from a shared queue directory (sharded export)")
+    args = parser.parse_args()
+    
+    if args.serve:
+        run_service(args)
+        return
+    if args.shard_worker:
+        print(f"Print Manager shard worker on {args.shard_worker}")
+        run_shard_worker(args.shard_worker)
+        return
+    
     if DND_AVAILABLE:
         root = TkinterDnD.Tk()
     else:
         root = tk.Tk()
     
     app = DruckManager(root)
+    # Startzeit messen sobald das Fenster bedienbar ist; "--measure-startup" beendet danach
+    root.after_idle(lambda: app.on_startup_complete(exit_after=args.measure_startup))
     root.mainloop()
 
 
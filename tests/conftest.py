@@ -0,0 +1,68 @@
+import os
+import sys
+import tkinter as tk
+
+import pytest
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import druckmgr  # noqa: E402
+
+
+# Testbilder: name -> (bildgroesse, inhalt (links, oben, rechts, unten), modus)
+CORPUS = {
+    'landscape': ((1400, 1000), (100, 100, 1300, 900), 'RGB'),
+    'portrait': ((800, 1200), (50, 80, 750, 1120), 'RGB'),
+    'alpha': ((600, 500), (30, 40, 530, 440), 'RGBA'),
+    'marker': ((400, 300), (0, 0, 400, 300), 'RGB'),
+}
+# Paare und Spiegelungen des Testauftrags; Seite 4 ist eine leere Rueckseite
+PAIRS = [('landscape', 'portrait'), ('alpha', None), ('marker', 'marker')]
+MIRRORS = {(2, 'back'): 'h'}
+# Kuerzere Seite > 2x laengste Seitenkante bei 300 dpi, damit der Verkleinerungspfad greift
+LARGE_SIZE = (11000, 8000)
+
+
+@pytest.fixture
+def app():
+    """Headless DruckManager with the default export settings"""
+    app = druckmgr.DruckManager(tk.Tcl(), headless=True)
+    app.auto_trim.set(True)
+    app.scale_to_width.set(True)
+    app.pdf_landscape.set(False)
+    app.margin.set(1.0)
+    return app
+
+
+@pytest.fixture(scope='session')
+def corpus(tmp_path_factory):
+    """Generated images: white or transparent border around a content rectangle"""
+    directory = tmp_path_factory.mktemp('corpus')
+    paths = {}
+    for name, (size, box, mode) in CORPUS.items():
+        background = (0, 0, 0, 0) if mode == 'RGBA' else 'white'
+        img = Image.new(mode, size, background)
+        draw = ImageDraw.Draw(img)
+        if name == 'marker':
+            # Linke Haelfte rot, rechte blau: zeigt die Spiegelung eindeutig
+            draw.rectangle((0, 0, size[0] // 2 - 1, size[1] - 1), fill=(255, 0, 0))
+            draw.rectangle((size[0] // 2, 0, size[0] - 1, size[1] - 1), fill=(0, 0, 255))
+        else:
+            draw.rectangle((box[0], box[1], box[2] - 1, box[3] - 1), fill=(40, 90, 160, 255))
+        paths[name] = str(directory / f"{name}.png")
+        img.save(paths[name])
+        if name == 'marker':
+            # Handyfoto-Fall: gleiches Motiv als JPEG mit EXIF-Orientierung 6 (90 Grad im Uhrzeigersinn)
+            exif = Image.Exif()
+            exif[druckmgr.EXIF_ORIENTATION] = 6
+            paths['rotated'] = str(directory / 'rotated.jpg')
+            img.save(paths['rotated'], exif=exif.tobytes(), quality=95)
+
+    # Grosses Graustufen-JPEG (88 MB unkomprimiert), einmalig vor den Messungen
+    large = Image.new('L', LARGE_SIZE, 255)
+    ImageDraw.Draw(large).rectangle((600, 400, 10399, 7599), fill=90)
+    paths['large'] = str(directory / 'large.jpg')
+    large.save(paths['large'], quality=85)
+    large.close()
+    return paths
@@ -0,0 +1,61 @@
+import base64
+import re
+import threading
+import time
+import zlib
+
+import druckmgr
+
+
+def read_pdf_layout(path):
+    """Bildplatzierung je Seite aus einem reportlab-PDF: (breite, hoehe, x, y) in pt oder None"""
+    spans, trailer = druckmgr.read_pdf_objects(path)
+    with open(path, 'rb') as f:
+        def read_object(number):
+            offset, length = spans[number]
+            f.seek(offset)
+            return f.read(length)
+
+        root = int(re.search(rb'/Root (\d+) 0 R', trailer).group(1))
+        pages = read_object(int(re.search(rb'/Pages (\d+) 0 R', read_object(root)).group(1)))
+        layout = []
+        for kid in re.findall(rb'(\d+) 0 R', pages[pages.index(b'/Kids'):]):
+            contents = read_object(int(re.search(rb'/Contents (\d+) 0 R', read_object(int(kid))).group(1)))
+            stream = contents[contents.index(b'stream') + 6:contents.rindex(b'endstream')].strip()
+            if b'ASCII85Decode' in contents:
+                stream = base64.a85decode(stream[:-2] if stream.endswith(b'~>') else stream)
+            if b'FlateDecode' in contents:
+                stream = zlib.decompress(stream)
+            match = re.search(rb'q\n(\S+) 0 0 (\S+) (\S+) (\S+) cm\n/\S+ Do', stream)
+            layout.append(tuple(float(value) for value in match.groups()) if match else None)
+    return layout
+
+
+class StageMonitor:
+    """Zeit und RSS-Spitze eines Abschnitts messen (RSS per Hintergrund-Thread abgetastet)"""
+
+    def __init__(self):
+        self.seconds = 0.0
+        self.rss_growth = 0
+        self._running = False
+
+    def __enter__(self):
+        self._start_rss = druckmgr.ResourceGovernor.read_memory()[0] or 0
+        self._peak = self._start_rss
+        self._running = True
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        self._t0 = time.perf_counter()
+        return self
+
+    def _sample(self):
+        while self._running:
+            self._peak = max(self._peak, druckmgr.ResourceGovernor.read_memory()[0] or 0)
+            time.sleep(0.01)
+
+    def __exit__(self, *exc):
+        self.seconds = time.perf_counter() - self._t0
+        self._running = False
+        self._thread.join()
+        self.rss_growth = self._peak - self._start_rss
+        return False
@@ -0,0 +1,54 @@
+from PIL import Image
+
+import druckmgr
+from conftest import CORPUS, LARGE_SIZE, MIRRORS, PAIRS
+from helpers import StageMonitor
+
+# Budgets: Sekunden bzw. MB RSS-Zuwachs (grosszuegig, gegen Ausreisser, nicht gegen Rauschen)
+BUDGETS = {
+    'trim': 2.0,
+    'pdf_export': 15.0,
+    'docx_export': 15.0,
+    'large_image': 8.0,
+    'large_image_rss_mb': 150,
+}
+
+
+def plan(app, corpus):
+    images = [tuple(corpus[name] if name else None for name in pair) for pair in PAIRS]
+    return app.build_page_plan(images, MIRRORS)
+
+
+def test_trim_budget(app, corpus):
+    with StageMonitor() as stage:
+        for name in CORPUS:
+            with Image.open(corpus[name]) as img:
+                app.trim_image(img)
+    assert stage.seconds <= BUDGETS['trim']
+
+
+def test_pdf_export_budget(app, corpus, tmp_path):
+    with StageMonitor() as stage:
+        app.render_pdf(str(tmp_path / 'budget.pdf'), plan(app, corpus), app.export_settings())
+    assert stage.seconds <= BUDGETS['pdf_export']
+
+
+def test_docx_export_budget(app, corpus, tmp_path):
+    pages = plan(app, corpus)
+    settings = app.export_settings()
+    writer = druckmgr.DocxExportWriter(app, str(tmp_path / 'budget.docx'), settings, len(pages))
+    with StageMonitor() as stage:
+        app.run_export(pages, settings, [writer])
+    assert stage.seconds <= BUDGETS['docx_export']
+
+
+def test_large_image_budget(app, corpus):
+    # Grosses Bild: frueh verkleinert, ohne Vollbild im Speicher
+    settings = app.export_settings()
+    page = {'path': corpus['large'], 'pair_index': 0, 'side': 'front', 'mirror': 'h'}
+    with StageMonitor() as stage:
+        base = app.load_export_base(page, settings)
+        app.prepare_pdf_page(page, settings, 21.0, 29.7, base_img=base)
+    assert base.width < LARGE_SIZE[0]
+    assert stage.seconds <= BUDGETS['large_image']
+    assert stage.rss_growth / druckmgr.MB <= BUDGETS['large_image_rss_mb']
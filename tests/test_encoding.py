@@ -0,0 +1,27 @@
+import pytest
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
+
+import druckmgr
+
+
+def text_page(tint=None):
+    """Textseite (leicht weichgezeichnet wie ein Scan), optional mit heller Flaeche im Tonwert tint"""
+    img = Image.new('L', (1240, 1754), 255)
+    draw = ImageDraw.Draw(img)
+    font = ImageFont.load_default(size=20)
+    for y in range(100, 1650, 80):
+        draw.text((80, y), "Lorem ipsum dolor sit amet, consectetur adipiscing elit", fill=20, font=font)
+    img = img.filter(ImageFilter.GaussianBlur(0.7))
+    if tint is not None:
+        ImageDraw.Draw(img).rectangle((150, 150, 250, 200), fill=tint)
+    return img
+
+
+def test_text_scan_is_bilevel():
+    assert druckmgr.classify_image_content(text_page()) == 'bilevel'
+
+
+@pytest.mark.parametrize('tint', [200, 223, 226, 232, 240, 250])
+def test_light_tint_stays_gray(tint):
+    # Die 1-Bit-Schwelle (128) wuerde diese Flaeche weiss machen
+    assert druckmgr.classify_image_content(text_page(tint)) == 'gray'
@@ -0,0 +1,114 @@
+import re
+import zipfile
+
+import pytest
+from PIL import Image
+
+import druckmgr
+from conftest import CORPUS, MIRRORS, PAIRS
+from helpers import read_pdf_layout
+
+# Soll-Platzierung im PDF (A4 hoch, 1 cm Rand) in pt: (breite, hoehe, x, y); None = leere Seite
+PDF_LAYOUT = [
+    (538.58, 359.06, 28.35, 241.42),
+    (528.50, 785.20, 33.39, 28.35),
+    (538.58, 430.87, 28.35, 205.51),
+    None,
+    (538.58, 403.94, 28.35, 218.98),
+    (538.58, 403.94, 28.35, 218.98),
+]
+# Soll-Bildgroessen im Word-Dokument (A4 quer, 1 cm Rand) in EMU
+DOCX_EXTENTS = [
+    (9972000, 6648000), (4603846, 6840000), (8550000, 6840000), (9120000, 6840000), (9120000, 6840000),
+]
+
+
+@pytest.fixture
+def images(corpus):
+    return [tuple(corpus[name] if name else None for name in pair) for pair in PAIRS]
+
+
+@pytest.fixture
+def pages(app, images):
+    return app.build_page_plan(images, MIRRORS)
+
+
+@pytest.mark.parametrize('name', CORPUS)
+def test_trim(app, corpus, name):
+    size, box, mode = CORPUS[name]
+    with Image.open(corpus[name]) as img:
+        assert app.trim_image(img).size == (box[2] - box[0], box[3] - box[1])
+
+
+def test_page_plan_parity_and_mirrors(pages, images):
+    assert len(pages) == 2 * len(images)
+    assert all(page is None or page['side'] == ('front', 'back')[number % 2]
+               for number, page in enumerate(pages))
+    assert [page and page['mirror'] for page in pages] == ['none', 'none', 'none', None, 'none', 'h']
+
+
+def test_mirror_pixels(app, pages):
+    mirrored = app.load_export_base(pages[5], app.export_settings()).convert('RGB')
+    assert mirrored.getpixel((10, 150)) == (0, 0, 255)
+    assert mirrored.getpixel((mirrored.width - 10, 150)) == (255, 0, 0)
+
+
+def test_single_sided_simplex(app, images, corpus):
+    duplex_pages, simplex_pages = app.plan_runs(images, MIRRORS, 'simplex')
+    assert len(duplex_pages) == 4
+    assert [page['path'] for page in simplex_pages] == [corpus['alpha']]
+
+
+def test_single_sided_back_to_back(app, images, corpus):
+    duplex_pages, simplex_pages = app.plan_runs(images, MIRRORS, 'back_to_back')
+    assert druckmgr.count_sheets(duplex_pages, simplex_pages) == 3
+    assert duplex_pages[4]['path'] == corpus['alpha']
+    assert duplex_pages[5] is None
+
+
+def test_exif_orientation_with_mirror(app, corpus):
+    # EXIF-Orientierung plus vertikale Spiegelung: rot (links) wird erst oben, dann unten
+    upright = app.load_base_image(corpus['rotated'], mirror_type='v').convert('RGB')
+    top, bottom = upright.getpixel((150, 10)), upright.getpixel((150, 390))
+    assert upright.size == (300, 400)
+    assert top[2] > 200 > top[0]
+    assert bottom[0] > 200 > bottom[2]
+
+
+def test_pdf_layout(app, pages, tmp_path):
+    pdf_path = str(tmp_path / 'layout.pdf')
+    app.render_pdf(pdf_path, pages, app.export_settings())
+    layout = read_pdf_layout(pdf_path)
+    assert len(layout) == len(PDF_LAYOUT)
+    for actual, expected in zip(layout, PDF_LAYOUT):
+        if expected is None:
+            assert actual is None
+        else:
+            assert actual == pytest.approx(expected, abs=0.05)
+
+
+def test_docx_layout(app, pages, tmp_path):
+    docx_path = str(tmp_path / 'layout.docx')
+    settings = app.export_settings()
+    app.run_export(pages, settings, [druckmgr.DocxExportWriter(app, docx_path, settings, len(pages))])
+    with zipfile.ZipFile(docx_path) as package:
+        document = package.read('word/document.xml').decode('utf-8')
+    extents = [(int(cx), int(cy)) for cx, cy in re.findall(r'<wp:extent cx="(\d+)" cy="(\d+)"/>', document)]
+    assert len(extents) == len(DOCX_EXTENTS)
+    for actual, expected in zip(extents, DOCX_EXTENTS):
+        assert actual == pytest.approx(expected, abs=2)
+    assert document.count('w:type="page"') == len(pages) - 1
+    assert document.count('(No back side)') == 1
+
+
+def test_docx_simplex_page_breaks(app, images, tmp_path):
+    # Einseitige Ausgabe: kein Umbruch nach der letzten Seite, sonst druckt Word ein leeres Blatt
+    simplex_pages = app.plan_runs(images * 3, MIRRORS, 'simplex')[1]
+    docx_path = str(tmp_path / 'layout_simplex.docx')
+    settings = app.export_settings()
+    app.run_export(simplex_pages, settings,
+                   [druckmgr.DocxExportWriter(app, docx_path, settings, len(simplex_pages))])
+    with zipfile.ZipFile(docx_path) as package:
+        document = package.read('word/document.xml').decode('utf-8')
+    assert len(simplex_pages) == 3
+    assert document.count('w:type="page"') == len(simplex_pages) - 1
@@ -0,0 +1,39 @@
+import random
+
+import pytest
+
+import druckmgr
+
+
+def brute_force_pairs(files, signatures):
+    """Referenz: paarweiser Vergleich wie vor dem Index"""
+    paired, pairs = set(), []
+    for i, path in enumerate(files):
+        if i in paired:
+            continue
+        paired.add(i)
+        aspect, dhash = signatures[path]
+        candidates = [j for j in range(len(files)) if j not in paired and signatures[files[j]][0] == aspect]
+        candidates = candidates or [j for j in range(i + 1, len(files)) if j not in paired][:1]
+        if not candidates:
+            pairs.append((path, None))
+            continue
+        best = min(candidates, key=lambda j: ((dhash ^ signatures[files[j]][1]).bit_count(), j))
+        paired.add(best)
+        pairs.append((path, files[best]))
+    return pairs
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_similarity_matches_brute_force(seed):
+    rng = random.Random(seed)
+    files = [f"scan_{n}.jpg" for n in range(rng.randrange(1, 400))]
+    base = [rng.getrandbits(64) for _ in range(5)]
+    signatures = {}
+    for path in files:
+        # Mischung aus Duplikaten, nahen und zufaelligen Hashes in wenigen Formaten
+        noise = rng.choice([0, 1 << rng.randrange(64), rng.getrandbits(64)])
+        signatures[path] = (rng.choice([0.71, 1.41, None]), rng.choice(base) ^ noise)
+    engine = druckmgr.PairingEngine()
+    engine._signatures = dict(signatures)
+    assert engine.pair_similarity(files) == brute_force_pairs(files, signatures)
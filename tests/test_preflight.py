@@ -0,0 +1,32 @@
+import io
+
+import pytest
+from PIL import Image
+
+import druckmgr
+
+
+@pytest.fixture
+def camera_jpeg(tmp_path):
+    """JPEG mit eingebettetem Vorschau-JPEG (eigenes FF D9) im Kommentarsegment"""
+    thumbnail = io.BytesIO()
+    Image.new('RGB', (40, 30), 'red').save(thumbnail, 'JPEG')
+    data = io.BytesIO()
+    Image.linear_gradient('L').resize((600, 400)).convert('RGB').save(
+        data, 'JPEG', comment=thumbnail.getvalue())
+    return data.getvalue(), tmp_path
+
+
+@pytest.mark.parametrize('cut', [2, 27, 4000])
+def test_truncated_jpeg_with_embedded_thumbnail(camera_jpeg, cut):
+    data, directory = camera_jpeg
+    path = directory / 'truncated.jpg'
+    path.write_bytes(data[:-cut])
+    assert druckmgr.preflight_image(str(path))['corrupt']
+
+
+def test_jpeg_with_trailing_data(camera_jpeg):
+    data, directory = camera_jpeg
+    path = directory / 'trailer.jpg'
+    path.write_bytes(data + b'\0' * 64 + b'\xff\xd8\xff\xd9')
+    assert not druckmgr.preflight_image(str(path))['corrupt']
@@ -0,0 +1,24 @@
+import pytest
+
+import druckmgr
+
+
+@pytest.fixture
+def service(app, tmp_path):
+    return druckmgr.PrintPrepService(app, workers=1, result_dir=str(tmp_path))
+
+
+@pytest.mark.parametrize('spec', [
+    {'pairs': []},
+    {'pairs': [[None, None]]},
+    {'pairs': [[None, None], [None]]},
+    {'files': []},
+])
+def test_job_without_images_is_rejected(service, spec):
+    with pytest.raises(ValueError, match="no images"):
+        service.submit(spec)
+
+
+def test_job_with_single_image(service, corpus):
+    job = service.submit({'pairs': [[corpus['marker'], None]]})
+    assert job['pages'] == 2